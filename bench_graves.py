@@ -0,0 +1,83 @@
+# ------------------------------------------------\
+#  Time relative-cemetery lookups across a stash.
+#  Last update: 2026/10/18 @ 11:30pm.
+#
+#  Name:               bench_graves.py
+#  URI:                https://github.com/doug-foster/find-a-grave-tools
+#  Description:	       Time relative-cemetery lookups across a stash.
+#  Version:            1.2.3
+#  Requires at least:  3.1 Python
+#  Prefers:            3.12 Python
+#  Author:             Doug Foster
+#  Author URI:         http://dougfoster.me
+#  License:            GPL v3 or later
+#  License URI:        https://www.gnu.org/licenses/agpl-3.0.html
+#  Update URI:         https://github.com/doug-foster/find-a-grave-tools
+#  Text Domain:        find-a-grave-tools
+#
+#  Every page in the master index is looked up two ways:
+#   soup = make_soup() + soup_find(soup, 'cemetery'), the old route.
+#   scan = grave_digger.find_cemetery(), no parse.
+#  Reports the time for each & any pages where the values differ.
+#  "--limit N" only uses the first N pages.
+# ------------------------------------------------\
+
+# --- Import libraries. ---
+# Standard Libraries
+import time  #https://docs.python.org/3/library/time.html
+# My modules
+import toolbox  # https://github.com/doug-foster/find-a-grave-tools
+import grave_digger  # https://github.com/doug-foster/find-a-grave-tools
+
+# --- Globals. ---
+path_to_stash = grave_digger.path_to_stash
+
+# --- Start. ---
+toolbox.print_l('\nStarted script @ ' + time.strftime('%Y%m%d-%H%M%S') + '.')
+
+# --- Pages from the master file index. ---
+grave_digger.read_master_index()
+file_names = [entry['file'] for entry in
+	grave_digger.master_file_index.values()]
+limit = int(toolbox.get_option('limit', len(file_names)))
+file_names = file_names[:limit]
+toolbox.print_l(str(len(file_names)) + ' pages, parser ' +
+	grave_digger.parser_name() + '.')
+
+# --- Soup. ---
+soup_values = []
+start = time.perf_counter()
+for file_name in file_names :
+	soup = grave_digger.make_soup(grave_digger.read_page(file_name))
+	soup_values.append(grave_digger.soup_find(soup, 'cemetery'))
+soup_time = time.perf_counter() - start
+
+# --- Scan. ---
+scan_values = []
+fallbacks = 0
+start = time.perf_counter()
+for file_name in file_names :
+	value = grave_digger.find_cemetery(file_name)
+	if None == value :  # member_cemetery() would parse this one.
+		fallbacks += 1
+	scan_values.append(value)
+scan_time = time.perf_counter() - start
+
+# --- Report. ---
+differ = 0
+for index in range(len(file_names)) :
+	if None == scan_values[index] : continue
+	if (soup_values[index] or '') != scan_values[index] :
+		differ += 1
+		toolbox.print_l('Differ: ' + file_names[index])
+toolbox.print_l('Soup: ' + format(soup_time, '.3f') + 's')
+toolbox.print_l('Scan: ' + format(scan_time, '.3f') + 's, ' +
+	str(fallbacks) + ' need a parse')
+if 0 < scan_time :
+	toolbox.print_l('Scan is ' + format(soup_time / scan_time, '.1f') +
+		'x faster, ' + str(differ) + ' values differ.')
+
+# --- Finish. ---
+toolbox.print_l('Finished script @ ' + time.strftime('%Y%m%d-%H%M%S') + '.')
+
+# ------------------------------------------------/
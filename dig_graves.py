@@ -22,6 +22,7 @@ import time  #https://docs.python.org/3/library/time.html
 import os  # https://docs.python.org/3/library/os.html
 import glob  # https://docs.python.org/3/library/glob.html
 import re  # https://docs.python.org/3/library/re.html
+import multiprocessing  # https://docs.python.org/3/library/multiprocessing.html
 # Packages
 from bs4 import BeautifulSoup  # https://www.crummy.com/software/BeautifulSoup/bs4/doc/
 import xlsxwriter  # https://xlsxwriter.readthedocs.io/index.html
@@ -38,124 +39,213 @@ all_cells = 'A1:XFD1048576'
 
 # --- Functions. ---
 
-# --- Start. ---
-toolbox.print_l('\nStarted script @ ' + time.strftime('%Y%m%d-%H%M%S') + '.')
-
-# --- Read master file index. ---
-grave_digger.read_master_index()
-
-# --- Get digging instructions. ---
-instructions = grave_digger.dig_instructions()
-
-# --- Create workbook. ---
-workbook_name = path_to_output + 'burials.xlsx'
-workbook = xlsxwriter.Workbook(workbook_name)
-workbook.set_size(1200, 800)
-
-# --- Create formats. ---
-format_bold = workbook.add_format({'bold': 1})
-format_text = workbook.add_format({'num_format': '@'})
-format_wrap = workbook.add_format({'text_wrap': True})
-format_red = workbook.add_format({'font_color': 'red'})
-formats = [format_bold, format_text, format_wrap, format_red]
-
-# --- Loop cemeteries. ---
-for cemetery_id, groups in instructions.items() :
-
-	# -- Set cemetery id & abbreviation.
-	cemetery_abrev =  cemetery_id.split('-')[1]  # Cemetery abbreviation.
-	cemetery_id =  cemetery_id.split('-')[0]  # Cemetery id.
-
-	# --- Get cemetery folder. ---
-	cemetery_folder = glob.glob(path_to_stash + '\\' + cemetery_id + '*_*/')[0]
-	if not os.path.exists(cemetery_folder) :  # Does folder exit?
-		toolbox.print_l('Error: Folder for cemetery id="' + cemetery_id +
-			'" does not exist.')
-		quit()
-
-	# --- Get burial folder. ---
-	burial_folder = cemetery_folder + cemetery_id + '_burials'
-	if not os.path.exists(burial_folder) :  # Does folder exit?
-		toolbox.print_l('Error: Burial folder for cemetery id="' + 
-			cemetery_id + '" does not exist.')
-		quit()
-
-	# --- Get burial list. ---
-	burial_list = burial_folder + '_list.txt'
-	if not os.path.exists(burial_list) :  # Does list exit?
-		toolbox.print_l('Error: Burial list for cemetery id="' + 
-			cemetery_id + '" does not exist.')
+# --- Main (worker processes import this script without running it). ---
+if '__main__' == __name__ :
+
+	# --- Start. ---
+	toolbox.print_l('\nStarted script @ ' + time.strftime('%Y%m%d-%H%M%S') + '.')
+
+	# --- Memorial database, or stashed pages? ---
+	# "--from_db" rebuilds the report from memorials.db, no pages parsed.
+	from_db = toolbox.get_option('from_db', False)
+
+	# --- Read master file index. ---
+	if not from_db : grave_digger.read_master_index()
+
+	# --- Get digging instructions. ---
+	instructions = grave_digger.dig_instructions()
+
+	# --- Worker processes parse burial pages, this process writes the workbook. ---
+	# "--workers N" or "workers : N" in the instructions file.
+	workers = int(toolbox.get_option('workers', 1))
+	pool = None
+	if workers > 1 and not from_db :
+		pool = multiprocessing.Pool(workers, grave_digger.start_dig_worker,
+			(path_to_stash, toolbox.options))
+		toolbox.print_l('Parsing burial pages with ' + str(workers) + ' workers.')
+
+	# --- Create workbook. ---
+	# "--streaming" writes each row to disk as it goes (constant_memory).
+	streaming = toolbox.get_option('streaming', False)
+	workbook_name = path_to_output + 'burials.xlsx'
+	workbook = xlsxwriter.Workbook(workbook_name, 
+		{'constant_memory' : bool(streaming)})
+	workbook.set_size(1200, 800)
+
+	# --- Parquet/Arrow export, written a cemetery at a time. ---
+	# "--export parquet" or "--export arrow", next to burials.xlsx.
+	# "--export" alone is parquet.
+	export = toolbox.get_option('export', False)
+	exporter = None
+	if True == export : export = 'parquet'
+	if False != export and export not in ['parquet', 'arrow'] :
+		toolbox.print_l('Error: unknown export "' + str(export) + 
+			'", use parquet or arrow.')
 		quit()
-
-	# --- Build a list of burials. ---
-	burials = []
-	lines = []
-	f = open(burial_list, 'r')
-	lines += f.read().splitlines()
-	f.close
-	# Set file path for each burial file.
-	for line in lines :
-		line = '_'.join(line.rsplit('\\',1))
-		line = burial_folder + '\\' + line.replace(fag_prefix, '') + '.html'
-		burials.append(line)
-
-	# --- Add a cemetery worksheet. ---
-	worksheet_id = workbook.add_worksheet(cemetery_abrev)
-	worksheet_id.ignore_errors({'number_stored_as_text': all_cells})
-	worksheet_id.freeze_panes(1, 0)
-
-	# --- Write cemetery worksheet header row. ---
-	num_row = 0
-	num_col = 0
-	args = ['', num_row, path_to_stash, formats]
-	cols_to_write = grave_digger.dig(args)  # Get header row.
-	for cell in cols_to_write :  # Loop columns.
-		worksheet_id.write(num_row, num_col, cell, format_bold)  # Write header.
-		num_col += 1
-	num_row = 1
-	toolbox.print_l()
-
-	# --- Worksheet data rows. ---
-	for burial_file_name in burials :  # Each row is a burial.
+	if False != export :
+		export_name = path_to_output + 'burials.' + export
+		exporter = grave_digger.open_export(export_name, export)
+
+	# --- Create formats. ---
+	format_bold = workbook.add_format({'bold': 1})
+	format_text = workbook.add_format({'num_format': '@'})
+	format_wrap = workbook.add_format({'text_wrap': True})
+	format_red = workbook.add_format({'font_color': 'red'})
+	formats = [format_bold, format_text, format_wrap, format_red]
+
+	# --- Loop cemeteries. ---
+	for cemetery_id, groups in instructions.items() :
+
+		# -- Set cemetery id & abbreviation.
+		cemetery_abrev =  cemetery_id.split('-')[1]  # Cemetery abbreviation.
+		cemetery_id =  cemetery_id.split('-')[0]  # Cemetery id.
+
+		# --- Burials from the memorial database. ---
+		if from_db :
+			burials = grave_digger.load_burials(cemetery_id)
+		else :
+			# --- Get cemetery folder. ---
+			cemetery_folder = glob.glob(path_to_stash + '\\' + cemetery_id + '*_*/')[0]
+			if not os.path.exists(cemetery_folder) :  # Does folder exit?
+				toolbox.print_l('Error: Folder for cemetery id="' + cemetery_id +
+					'" does not exist.')
+				quit()
+
+			# --- Get burial folder. ---
+			burial_folder = cemetery_folder + cemetery_id + '_burials'
+			if not os.path.exists(burial_folder) :  # Does folder exit?
+				toolbox.print_l('Error: Burial folder for cemetery id="' + 
+					cemetery_id + '" does not exist.')
+				quit()
+
+			# --- Get burial list. ---
+			burial_list = burial_folder + '_list.txt'
+			if not os.path.exists(burial_list) :  # Does list exit?
+				toolbox.print_l('Error: Burial list for cemetery id="' + 
+					cemetery_id + '" does not exist.')
+				quit()
+
+			# --- Build a list of burials. ---
+			burials = []
+			lines = []
+			f = open(burial_list, 'r')
+			lines += f.read().splitlines()
+			f.close
+			# Set file path for each burial file.
+			for line in lines :
+				line = '_'.join(line.rsplit('\\',1))
+				line = burial_folder + '\\' + line.replace(fag_prefix, '')
+				burials.append(grave_digger.stash_file(line))  # .html or .ref
+
+		# --- Check parser, no worksheet. ---
+		# "--check_parser lxml" extracts each burial with html.parser & lxml.
+		# Add "--partial_parse" to check an lxml partial parse. A bare
+		# "--check_parser" checks lxml.
+		check = toolbox.get_option('check_parser', False)
+		if False != check and not from_db :
+			if True == check : check = 'lxml'
+			partial = toolbox.get_option('partial_parse', False)
+			if 'html.parser' == check and not partial :
+				toolbox.print_l('Error: check_parser html.parser compares ' + 
+					'html.parser with itself, add partial_parse or use lxml.')
+				quit()
+			differ = 0
+			for burial in burials :
+				keys = grave_digger.check_parser(burial, check, partial)
+				if 0 != len(keys) :
+					differ += 1
+					toolbox.print_l('Differ: ' + burial + ' - ' + ', '.join(keys))
+			toolbox.print_l('Parser ' + check + ': ' + str(differ) + ' of ' + 
+				str(len(burials)) + ' burials differ from html.parser.')
+			continue
+
+		# --- Add a cemetery worksheet. ---
+		worksheet_id = workbook.add_worksheet(cemetery_abrev)
+		worksheet_id.ignore_errors({'number_stored_as_text': all_cells})
+		worksheet_id.freeze_panes(1, 0)
+
+		# --- Write cemetery worksheet header row. ---
+		num_row = 0
 		num_col = 0
-
-		# Get data row.
-		args = [burial_file_name, num_row, path_to_stash, formats]
-		toolbox.print_l(str(num_row) + ' of ' + str(len(burials)) + ', ', '')
-		toolbox.print_l('Cemetery: ' + cemetery_id + ', Memorial: ', '')
-		cols_to_write = grave_digger.dig(args)
-		rich_list = cols_to_write[2][1]  # Log name.
-		full_name = rich_list[len(rich_list)-1]
-		cols_to_write[2][1].remove(full_name)
-		toolbox.print_l(full_name + ' ', '')
-		# Write row data - one column at a time.
+		args = ['', num_row, path_to_stash, formats]
+		cols_to_write = grave_digger.dig(args)  # Get header row.
+		widths = None  # Column widths, streaming only.
+		if streaming : widths = grave_digger.fit_columns({}, cols_to_write)
 		for cell in cols_to_write :  # Loop columns.
-			toolbox.print_l('.', '')
-			# Write string.
-			if str == type(cell) :
-				worksheet_id.write(num_row, num_col, cell, format_wrap)
-			elif list == type(cell) and 'url' == cell[0] :
-				# Write link (list format is ['url'] [url] [text]).
-				url = cell[1]
-				text = cell[2]
-				worksheet_id.write_url(num_row, num_col, url, string=text)
-			elif list == type(cell) and 'rich_name' == cell[0] :
-				# Write rich string
-				worksheet_id.write_rich_string(num_row, num_col, *cell[1], 
-					format_wrap)
+			worksheet_id.write(num_row, num_col, cell, format_bold)  # Write header.
 			num_col += 1
-
-		# Increment row.
-		toolbox.print_l(' !',)
-		num_row += 1
-		# if 8 == num_row :  # Limit # of rows.
-		# 	break
-
-	# --- Wrap up cemetery worksheet. ---
-	grave_digger.adjust_worksheet(worksheet_id)
-
-# --- Finish. ---
-workbook.close()
-toolbox.print_l('Finished script @ ' + time.strftime('%Y%m%d-%H%M%S') + '.')
+		num_row = 1
+		export_rows = []
+		toolbox.print_l()
+
+		# --- Worksheet data rows. ---
+		# Burial files are parsed in order, by the pool if there is one.
+		# Every record is also saved to the memorial database.
+		if from_db :
+			records = map(grave_digger.load_record, burials)
+		elif None == pool :
+			records = map(grave_digger.dig_record, burials)
+		else :
+			chunk_size = max(1, len(burials) // (workers * 4))
+			records = pool.imap(grave_digger.dig_record, burials, chunk_size)
+		mem_ids = []
+		for burial, record in zip(burials, records) :  # Each row is a burial.
+			num_col = 0
+			if None == record :  # from_db, not saved by an earlier run.
+				toolbox.print_l('Memorial ' + burial + ' is not in ' + 
+					grave_digger.memorial_db_name + ', skipped.')
+				continue
+			if not from_db :
+				grave_digger.store_memorial(record)
+			mem_ids.append(record['id'])
+
+			# Get data row.
+			toolbox.print_l(str(num_row) + ' of ' + str(len(burials)) + ', ', '')
+			toolbox.print_l('Cemetery: ' + cemetery_id + ', Memorial: ', '')
+			cols_to_write = grave_digger.dig_row(record, formats)
+			rich_list = cols_to_write[2][1]  # Log name.
+			full_name = rich_list[len(rich_list)-1]
+			cols_to_write[2][1].remove(full_name)
+			toolbox.print_l(full_name + ' ', '')
+			if streaming : grave_digger.fit_columns(widths, cols_to_write)
+			if None != exporter : export_rows.append(grave_digger.export_row(record))
+			# Write row data - one column at a time.
+			for cell in cols_to_write :  # Loop columns.
+				toolbox.print_l('.', '')
+				# Write string.
+				if str == type(cell) :
+					worksheet_id.write(num_row, num_col, cell, format_wrap)
+				elif list == type(cell) and 'url' == cell[0] :
+					# Write link (list format is ['url'] [url] [text]).
+					url = cell[1]
+					text = cell[2]
+					worksheet_id.write_url(num_row, num_col, url, string=text)
+				elif list == type(cell) and 'rich_name' == cell[0] :
+					# Write rich string
+					worksheet_id.write_rich_string(num_row, num_col, *cell[1], 
+						format_wrap)
+				num_col += 1
+
+			# Increment row.
+			toolbox.print_l(' !',)
+			num_row += 1
+			# if 8 == num_row :  # Limit # of rows.
+			# 	break
+
+		# --- Wrap up cemetery worksheet. ---
+		grave_digger.adjust_worksheet(worksheet_id, widths)
+		if not from_db :
+			grave_digger.store_burials(cemetery_id, cemetery_abrev, mem_ids)
+		if None != exporter : grave_digger.write_export(exporter, export_rows)
+
+	# --- Finish. ---
+	if None != pool :
+		pool.close()
+		pool.join()
+	workbook.close()
+	if None != exporter : exporter.close()
+	grave_digger.close_fact_cache()
+	grave_digger.close_memorial_db()
+	toolbox.print_l('Finished script @ ' + time.strftime('%Y%m%d-%H%M%S') + '.')
 
 # ------------------------------------------------/
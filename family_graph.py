@@ -0,0 +1,324 @@
+# ------------------------------------------------\
+#  Family graph of stashed "Find a Grave" memorials.
+#  Last update: 2026/10/18 @ 11:59pm.
+#
+#  Name:               family_graph.py
+#  URI:                https://github.com/doug-foster/find-a-grave-tools
+#  Description:	       Family graph of stashed "Find a Grave" memorials
+#  Version:            1.2.3
+#  Requires at least:  3.1 Python
+#  Prefers:            3.12 Python
+#  Author:             Doug Foster
+#  Author URI:         http://dougfoster.me
+#  License:            GPL v3 or later
+#  License URI:        https://www.gnu.org/licenses/agpl-3.0.html
+#  Update URI:         https://github.com/doug-foster/find-a-grave-tools
+#  Text Domain:        find-a-grave-tools
+#
+#  Every stashed memorial & every family member they list is a node
+#  (an integer, index into graph['ids']). Edges are typed (edge_kinds) &
+#  stored both ways, e.g. A parent B is also B child A.
+#  Adjacency lists are arrays (compressed sparse rows): the edges of node n
+#  are graph['targets'] & graph['kinds'] [offsets[n] : offsets[n+1]].
+#
+#  Use:
+#   python family_graph.py --ancestors 123
+#   python family_graph.py --descendants 123 --generations 2
+#   python family_graph.py --path 123 --to 456
+#   --rebuild = build the graph from the stash, even if a saved one is current.
+# ------------------------------------------------\
+
+# --- Import libraries. ---
+# Standard Libraries.
+import os  # https://docs.python.org/3/library/os.html
+import time  # https://docs.python.org/3/library/time.html
+import pickle  # https://docs.python.org/3/library/pickle.html
+import collections  # https://docs.python.org/3/library/collections.html
+from array import array  # https://docs.python.org/3/library/array.html
+# Packages.
+# My modules.
+import toolbox  # https://github.com/doug-foster/find-a-grave-tools
+import grave_digger  # https://github.com/doug-foster/find-a-grave-tools
+
+# --- Globals. ---
+graph_file = 'family_graph.pkl'  # In path_to_stash, see save_graph().
+edge_kinds = ['parent', 'child', 'spouse', 'sibling', 'half-sibling']
+group_edges = {  # Family group : [kind, inverse kind], see edge_kinds.
+	'parents' : [0, 1],
+	'children' : [1, 0],
+	'spouses' : [2, 2],
+	'siblings' : [3, 3],
+	'half-siblings' : [4, 4]
+}
+
+# --- Functions. ---
+# build_graph()
+# save_graph(graph)
+# load_graph()
+# node_of(graph, mem_id)
+# edges(graph, node, kind)
+# ancestors(graph, mem_id, generations)
+# descendants(graph, mem_id, generations)
+# walk_kind(graph, mem_id, kind, generations)
+# kinship_path(graph, from_id, to_id)
+
+# --------------------------------------------\
+#  Build the family graph from the stash.
+#  Last update: 2026/10/18 @ 11:59pm.
+#
+#  Reads the master index, facts come from get_facts() (fact cache).
+# --------------------------------------------\
+def build_graph() :
+
+	# --- Vars. ---
+	ids = []
+	index = {}
+	pairs = set()  # (source node, target node, kind)
+
+	# --- Edges from each stashed memorial. ---
+	grave_digger.read_master_index()
+	for mem_id, entry in grave_digger.master_file_index.items() :
+		facts = grave_digger.get_facts(mem_id, entry['file'])
+		for person_id in [mem_id] + [person['id'] for group in group_edges
+			for person in facts['family'].get(group, [])] :
+			if '' != person_id and person_id not in index :  # New node.
+				index[person_id] = len(ids)
+				ids.append(person_id)
+		source = index[mem_id]
+		for group, kinds in group_edges.items() :
+			for person in facts['family'].get(group, []) :
+				if '' == person['id'] : continue
+				target = index[person['id']]
+				pairs.add((source, target, kinds[0]))
+				pairs.add((target, source, kinds[1]))
+
+	# --- Adjacency arrays, edges sorted by source node. ---
+	offsets = array('l', [0] * (len(ids) + 1))
+	targets = array('l')
+	kinds = array('b')
+	for source, target, kind in sorted(pairs) :
+		offsets[source + 1] += 1
+		targets.append(target)
+		kinds.append(kind)
+	for n in range(len(ids)) :
+		offsets[n + 1] += offsets[n]
+
+	return {'ids' : ids, 'index' : index, 'offsets' : offsets,
+		'targets' : targets, 'kinds' : kinds}
+# --------------------------------------------/
+
+
+# --------------------------------------------\
+#  Save the family graph next to the master index.
+#  Last update: 2026/10/18 @ 11:59pm.
+#
+#  Stamped with the master index mtime, see load_graph().
+# --------------------------------------------\
+def save_graph(graph) :
+
+	# --- Vars. ---
+	path = grave_digger.path_to_stash
+	saved = dict(graph)
+	del saved['index']  # Rebuilt from ids.
+	saved['stamp'] = os.path.getmtime(path + grave_digger.master_index)
+
+	# --- Save. ---
+	f = open(path + graph_file + '.tmp', 'wb')
+	pickle.dump(saved, f, pickle.HIGHEST_PROTOCOL)
+	f.close()
+	os.replace(path + graph_file + '.tmp', path + graph_file)
+# --------------------------------------------/
+
+
+# --------------------------------------------\
+#  Return the saved family graph, None if missing or stale.
+#  Last update: 2026/10/18 @ 11:59pm.
+#
+#  Stale = the master index changed since the graph was saved.
+# --------------------------------------------\
+def load_graph() :
+
+	# --- Vars. ---
+	path = grave_digger.path_to_stash
+
+	# --- Load. ---
+	if not os.path.isfile(path + graph_file) :
+		return None
+	f = open(path + graph_file, 'rb')
+	graph = pickle.load(f)
+	f.close()
+	if graph['stamp'] != os.path.getmtime(path + grave_digger.master_index) :
+		return None
+	graph['index'] = {graph['ids'][n] : n for n in range(len(graph['ids']))}
+	return graph
+# --------------------------------------------/
+
+
+# --------------------------------------------\
+#  Return the node of a memorial ID, None if not in the graph.
+#  Last update: 2026/10/18 @ 11:59pm.
+# --------------------------------------------\
+def node_of(graph, mem_id) :
+
+	# --- Look up. ---
+	return graph['index'].get(str(mem_id))
+# --------------------------------------------/
+
+
+# --------------------------------------------\
+#  Return the nodes linked to a node by one kind of edge (None = all).
+#  Last update: 2026/10/18 @ 11:59pm.
+#
+#  Returns a list of [node, kind].
+# --------------------------------------------\
+def edges(graph, node, kind = None) :
+
+	# --- Vars. ---
+	found = []
+	start = graph['offsets'][node]
+	stop = graph['offsets'][node + 1]
+
+	# --- Slice of the adjacency arrays. ---
+	for i in range(start, stop) :
+		if None == kind or kind == graph['kinds'][i] :
+			found.append([graph['targets'][i], graph['kinds'][i]])
+	return found
+# --------------------------------------------/
+
+
+# --------------------------------------------\
+#  Return the ancestors of a memorial.
+#  Last update: 2026/10/18 @ 11:59pm.
+#
+#  List of [memorial ID, generation], parents = 1, grandparents = 2, ...
+#  generations = how far back (None = all the way).
+# --------------------------------------------\
+def ancestors(graph, mem_id, generations = None) :
+
+	# --- Follow parent edges. ---
+	return walk_kind(graph, mem_id, 0, generations)
+# --------------------------------------------/
+
+
+# --------------------------------------------\
+#  Return the descendants of a memorial.
+#  Last update: 2026/10/18 @ 11:59pm.
+#
+#  List of [memorial ID, generation], children = 1, grandchildren = 2, ...
+#  generations = how far down (None = all the way).
+# --------------------------------------------\
+def descendants(graph, mem_id, generations = None) :
+
+	# --- Follow child edges. ---
+	return walk_kind(graph, mem_id, 1, generations)
+# --------------------------------------------/
+
+
+# --------------------------------------------\
+#  Breadth first walk along one kind of edge.
+#  Last update: 2026/10/18 @ 11:59pm.
+#
+#  Returns a list of [memorial ID, distance], nearest first.
+# --------------------------------------------\
+def walk_kind(graph, mem_id, kind, generations = None) :
+
+	# --- Vars. ---
+	start = node_of(graph, mem_id)
+	found = []
+	if None == start :
+		return found
+	seen = {start}
+	queue = collections.deque([[start, 0]])
+
+	# --- Walk. ---
+	while 0 != len(queue) :
+		node, distance = queue.popleft()
+		if None != generations and distance >= generations : continue
+		for target, target_kind in edges(graph, node, kind) :
+			if target in seen : continue
+			seen.add(target)
+			found.append([graph['ids'][target], distance + 1])
+			queue.append([target, distance + 1])
+	return found
+# --------------------------------------------/
+
+
+# --------------------------------------------\
+#  Return the shortest kinship path between two memorials.
+#  Last update: 2026/10/18 @ 11:59pm.
+#
+#  List of [memorial ID, kind] steps from from_id, e.g.
+#  [['123', ''], ['11', 'parent'], ['456', 'child']] = 456 is a sibling (or
+#  half-sibling) through parent 11. [] if not related.
+# --------------------------------------------\
+def kinship_path(graph, from_id, to_id) :
+
+	# --- Vars. ---
+	start = node_of(graph, from_id)
+	goal = node_of(graph, to_id)
+	if None == start or None == goal :
+		return []
+	came_from = {start : None}  # Node : [previous node, kind].
+	queue = collections.deque([start])
+
+	# --- Breadth first search. ---
+	while 0 != len(queue) and goal not in came_from :
+		node = queue.popleft()
+		for target, kind in edges(graph, node) :
+			if target not in came_from :
+				came_from[target] = [node, kind]
+				queue.append(target)
+	if goal not in came_from :
+		return []
+
+	# --- Path, goal back to start. ---
+	path = []
+	node = goal
+	while None != came_from[node] :
+		previous, kind = came_from[node]
+		path.insert(0, [graph['ids'][node], edge_kinds[kind]])
+		node = previous
+	path.insert(0, [graph['ids'][start], ''])
+	return path
+# --------------------------------------------/
+
+
+# --- Main (other scripts import this module without running it). ---
+if '__main__' == __name__ :
+
+	# --- Start. ---
+	toolbox.print_l('\nStarted script @ ' + time.strftime('%Y%m%d-%H%M%S') + '.')
+
+	# --- Saved graph, or build it. ---
+	graph = None
+	if not toolbox.get_option('rebuild', False) : graph = load_graph()
+	if None == graph :
+		toolbox.print_l('Building family graph.')
+		graph = build_graph()
+		save_graph(graph)
+		grave_digger.close_fact_cache()
+	toolbox.print_l(str(len(graph['ids'])) + ' people, ' +
+		str(len(graph['targets'])) + ' edges.')
+
+	# --- Queries. ---
+	generations = toolbox.get_option('generations', None)
+	if None != generations : generations = int(generations)
+	mem_id = toolbox.get_option('ancestors', None)
+	if None != mem_id :
+		for found, generation in ancestors(graph, mem_id, generations) :
+			toolbox.print_l(str(generation) + ' ' + found)
+	mem_id = toolbox.get_option('descendants', None)
+	if None != mem_id :
+		for found, generation in descendants(graph, mem_id, generations) :
+			toolbox.print_l(str(generation) + ' ' + found)
+	mem_id = toolbox.get_option('path', None)
+	if None != mem_id :
+		path = kinship_path(graph, mem_id, toolbox.get_option('to', ''))
+		if 0 == len(path) : toolbox.print_l('Not related.')
+		for found, kind in path :
+			toolbox.print_l((kind + ' ' + found).strip())
+
+	# --- Finish. ---
+	toolbox.print_l('Finished script @ ' + time.strftime('%Y%m%d-%H%M%S') + '.')
+
+# ------------------------------------------------/
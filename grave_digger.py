@@ -22,9 +22,31 @@ import os  # https://docs.python.org/3/library/os.html
 import glob  # https://docs.python.org/3/library/glob.html
 import re  # https://docs.python.org/3/library/re.html
 import inspect  # https://docs.python.org/3/library/inspect.html
+import json  # https://docs.python.org/3/library/json.html
+import sqlite3  # https://docs.python.org/3/library/sqlite3.html
+import hashlib  # https://docs.python.org/3/library/hashlib.html
+import gzip  # https://docs.python.org/3/library/gzip.html
+import mmap  # https://docs.python.org/3/library/mmap.html
+import html  # https://docs.python.org/3/library/html.html
+import heapq  # https://docs.python.org/3/library/heapq.html
 from urllib.parse import unquote  # https://docs.python.org/3/library/urllib.html
 # Packages.
 from bs4 import BeautifulSoup  # https://www.crummy.com/software/BeautifulSoup/bs4/doc/
+from bs4 import SoupStrainer  # https://www.crummy.com/software/BeautifulSoup/bs4/doc/
+from xlsxwriter.utility import xl_pixel_width  # https://xlsxwriter.readthedocs.io/utility.html
+try :  # Optional, faster parser, see make_soup().
+	import lxml  # https://lxml.de/
+except ImportError :
+	lxml = None
+try :  # Optional, Parquet/Arrow export, see open_export().
+	import pyarrow  # https://arrow.apache.org/docs/python/
+	import pyarrow.parquet  # https://arrow.apache.org/docs/python/parquet.html
+except ImportError :
+	pyarrow = None
+try :  # Optional, page store falls back to gzip.
+	import zstandard  # https://pypi.org/project/zstandard/
+except ImportError :
+	zstandard = None
 # My modules.
 import toolbox  # https://github.com/doug-foster/find-a-grave-tools
 import requests  # https://pypi.org/project/requests/
@@ -34,20 +56,35 @@ path_to_stash = 'C:\\Dev\\FindAGrave\\Stash\\'
 path_to_output = 'C:\\Dev\\FindAGrave\\Output\\'
 master_list = 'master_list.txt'
 master_index = 'master_index.txt'
+fact_cache_db = 'fact_cache.db'
+fact_cache_version = 4  # Bump when extract_memorial() output changes.
+stash_db_name = 'stash.db'
+page_store_folder = 'pages'  # Compressed page bodies, see write_page().
+memorial_db_name = 'memorials.db'  # Extracted records, in path_to_output.
+memorial_db_version = 1  # Bump when the memorial database tables change.
 find_a_grave = 'https://www.findagrave.com'
 fag_prefix = 'https://www.findagrave.com/memorial/'
 cookie_domain = 'www.findagrave.com/'
-master_urls = []
-master_file_index = []
+master_urls = {}  # { memorial id : canonical url }, see build_master_list().
+master_ids = {}  # { memorial id : set of list file names listing it }.
+master_file_index = {}
+fact_cache = None
+fact_memo = {}
+stash_db = None
+journaled = {}  # { cemetery id : set of (group, page) }, this run's jobs.
+memorial_db = None
+html_parser = None  # Parser name for BeautifulSoup, see make_soup().
 family_groups = ['parent', 'spouse', 'child', 'sibling', 'half-sibling']
 family_groups_all = family_groups
 family_groups_all.insert(0, 'burial')
 family_groups_names = ['burials', 'parents', 'spouses', 'children', 
 	'siblings', 'half-siblings']
+instruction_options = ['workers', 'fetchers', 'rps', 'host_rps', 
+	'incremental', 'page_store', 'parser', 'check_parser', 'partial_parse', 
+	'streaming', 'export', 'from_db', 'hops', 'http_cache', 
+	'http_cache_size', 'timeout', 'pace']  # e.g. "workers : 4", see get_option().
 data_groups_all = ['totals', 'names']
-lat_long = None
 cemetery_folders = []
-g_map = ''
 cemetery = ['cemetery', 'Cemetery']
 surname = ['surname', 'Surname']
 name = ['name', 'Name']
@@ -74,6 +111,35 @@ longitude = ['longitude', 'Longitude']
 inscription = ['Inscription']
 inscription = ['inscription', 'Inscription']
 gravesite_details = ['gravesite_details', 'Gravesite Details']
+memorial_text_ids = {  # Record key : element id, text values.
+	'id' : 'memNumberLabel',
+	'birth' : 'birthDateLabel',
+	'birth_location' : 'birthLocationLabel',
+	'death' : 'deathDateLabel',
+	'death_location' : 'deathLocationLabel',
+	'plot' : 'plotValueLabel'
+}
+memorial_markup_ids = {  # Record key : element id, markup values.
+	'bio' : 'partBio',
+	'inscription' : 'inscriptionValue',
+	'gravesite_details' : 'gravesite-details'
+}
+memorial_columns = ['id', 'url', 'name', 'surname', 'parents_surname',
+	'birth', 'birth_location', 'death', 'death_location', 'cemetery',
+	'cenotaph', 'veteran', 'plot', 'bio', 'inscription', 'gravesite_details',
+	'google_map', 'latitude', 'longitude']  # Record keys, memorials table.
+memorial_ids = set(memorial_text_ids.values()) | \
+	set(memorial_markup_ids.values()) | \
+	{'bio-name', 'cemeteryNameLabel', 'cemeteryLabel', 'gpsValue'}
+cemetery_label = re.compile(rb'id=["\']?cemeteryNameLabel\b')
+cemetery_link = re.compile(rb'<a\s[^>]*?href=["\']([^"\']*)["\'][^>]*>\s*$')
+family_labels = {  # aria-labelledby : family group.
+	'parentsLabel' : 'parents',
+	'spouseLabel' : 'spouses',
+	'childrenLabel' : 'children',
+	'siblingLabel' : 'siblings',
+	'halfSibLabel' : 'half-siblings'
+}
 row_data = [
 	cemetery,
 	surname,
@@ -105,21 +171,84 @@ row_data = [
 # --- Functions. ---
 # dig_instructions()
 # find_burial_urls(args)
-# find_family_urls(group, soup)
+# search_burial_urls(session, cemetery_id)
+# url_memorial_id(url)
+# diff_urls(old_urls, new_urls)
+# read_url_list(path_to_list_file)
+# write_url_list(path_to_list_file, urls)
+# stashed_ids(path_to_group_folder)
+# page_family_urls(file_name)
+# crawl_frontier(session, frontier, hops, groups, path_to_folder, fetchers,
+#	cemetery_id)
+# open_stash_db()
+# close_stash_db()
+# group_page_name(args)
+# page_validators(page)
 # stash_group_page(args)
-# pause_digging()
+# stash_group_pages(session, group, jobs, path_to_folder, fetchers, cemetery_id)
+# journal_jobs(cemetery_id, group, jobs, pages, urls)
+# journal_page(cemetery_id, group, page, fetched)
+# finish_journal(cemetery_id)
+# save_group_page(args, request)
+# stash_file(page)
+# write_page(page, text)
+# read_page(file_name)
+# blob_name(sha256, codec)
+# sweep_page_store()
+# remove_stale_pages(path_to_group_folder, pages)
+# remove_pages_of(path_to_group_folder, group, burial_urls)
+# remove_crawled_of(cemetery_id, group, burial_urls)
+# remove_page(file_name)
+# pause_digging(low, high)
 # build_master_list()
+# canonical_url(url)
+# is_master_url(url)
+# add_master_url(url, list_name)
+# forget_master_ids(list_name, mem_ids)
 # save_master_list()
+# memorial_id(file_name)
+# index_line(file_name)
 # build_master_index()
+# update_master_index(added_files, removed_files)
 # read_master_index()
+# open_fact_cache()
+# close_fact_cache()
+# get_facts(mem_id, file_name)
+# extract_memorial(soup)
+# family_member(person)
+# member_cemetery(mem_id)
+# find_cemetery(file_name)
+# dig_record(burial_file_name)
+# start_dig_worker(stash)
 # dig(args)
+# dig_row(record, formats)
 # dig_this(args)
-# get_by_group(soup, group, formats)
+# get_by_group(record, group, formats)
 # build_link(url, text)
 # lat_long(which, gmap_url='')
-# adjust_worksheet(worksheet)
+# adjust_worksheet(worksheet, widths=None)
+# fit_columns(widths, cols_to_write)
+# export_schema()
+# export_row(record)
+# export_member(person, cemeteries)
+# open_export(file_name, kind)
+# write_export(writer, rows)
+# open_memorial_db()
+# close_memorial_db()
+# store_memorial(record)
+# store_burials(cemetery_id, abbreviation, mem_ids)
+# load_record(mem_id)
+# load_burials(cemetery_id)
+# date_year(date)
 # soup_find(soup, what, type, value=)
-# parent_surname(soup, mem_url, formats)
+# make_soup(markup, parser='', partial=False)
+# parser_name()
+# MemorialStrainer
+# keep_tag(name, attrs)
+# family_names(soup, label)
+# list_names(family_list)
+# check_parser(file_name, parser, partial=False)
+# parent_surname(record)
 # bold_last_name(full_name, formats)
 
 # --------------------------------------------\
@@ -166,6 +295,11 @@ def dig_instructions() :
 		if 'log' == this_line[0] :
 			toolbox.log()  # Start logging.
 			continue
+		if this_line[0] in instruction_options :  # Option, not a cemetery.
+			if len(this_line) > 1 : value = this_line[1]
+			else : value = True
+			toolbox.options[this_line[0]] = value
+			continue
 		num = this_line[0].split('-')[0]  # Cemetery abbreviation.
 		if not num.isnumeric() :  # Invalid cemetery #?
 			toolbox.print_l('Error: instructions - cemetery ' + this_line[0] + 
@@ -209,7 +343,7 @@ def dig_instructions() :
 #  Search cemetery index page(s) for memorial urls.
 #  Last update: 2024/06/03 @ 08:45am.
 #
-#  Sister function is find_family_urls().
+#  Sister function is page_family_urls().
 #  Build an list file, return an array.
 # --------------------------------------------\
 def get_memorials(session, searchUrl) :
@@ -228,9 +362,12 @@ def get_memorials(session, searchUrl) :
 
 		# --- Get index page. ---
 		request = toolbox.get_url(session, searchUrl + '&page=' + str(page))
+		if False == request :  # Retries ran out.
+			toolbox.print_l('Error: page ' + str(page) + ' failed, stopping.')
+			break
 
 		# -- Make burial soup. --
-		soup = BeautifulSoup(request.content, 'html.parser')
+		soup = make_soup(request.content)
 
 		# --- If last page, stop looping. ---
 		# Search page tags for warnings.
@@ -270,7 +407,7 @@ def get_memorials(session, searchUrl) :
 
 		if (loop) :
 			page += 1  # Increment page.
-			toolbox.pause(0.5,2,True)  # Pace requests.
+			pause_digging(0.5,2)  # Pace requests.
 
 	return memorials
 
@@ -278,68 +415,320 @@ def get_memorials(session, searchUrl) :
 
 
 # --------------------------------------------\
-#  Search memorial page soup for group (aka family) memorial URLs.
-#  Last update: 2024/06/10 @ 12:00pm.
+#  Search cemetery index page(s) for burial memorial urls.
+#  Last update: 2026/10/18 @ 06:00pm.
 #
-#  Sister function is find_burial_urls().
-#  Return an array of memorial URLs.
-#  Used by stash_graves.py.
-#  NOT used by dig_graves.py.
+#  Sister function is page_family_urls().
+#  Build a burial list file, return an array.
+#  args = [session, cemetery_id, path_to_list, group]
+#  Return False (no list written) if a search page failed.
 # --------------------------------------------\
-def find_family_urls(group, soup) :
+def find_burial_urls(args) :
 
 	# --- Vars. ---
-	family_urls = []
+	session = args[0]
+	cemetery_id = args[1]
+	path_to_list = args[2]
+	group = args[3]
 
-	# --- Check input. ---
-	if 'soup' not in locals():
-		toolbox.print_l('Error: no Soup.')
+	# --- Search cemetery. ---
+	burial_urls = search_burial_urls(session, cemetery_id)
+	if False == burial_urls :
 		return False
 
-	# --- Set element label for this group. ---
-	match group :
-		case 'parent' :
-			family = soup_find(soup, 'parents')
-		case 'spouse' :
-			family = soup_find(soup, 'spouses')
-		case 'child' :
-			family = soup_find(soup, 'children')		
-		case 'sibling' :
-			family = soup_find(soup, 'siblings')
-		case 'half-sibling' :
-			family = soup_find(soup, 'half-siblings')
-	if 0 == len(family) : return ''
-	
-	# --- Find links in soup. ---
-	for member in family :
-		family_url = find_a_grave + soup_find(soup, 'person_url', '', member)
-		family_urls.append(family_url)
+	# --- Write burial list. ---
+	write_url_list(path_to_list[group], burial_urls)
+	return burial_urls
+# --------------------------------------------/
+
+
+# --------------------------------------------\
+#  Return the burial memorial urls listed for a cemetery.
+#  Last update: 2026/10/18 @ 11:59pm.
+#
+#  False if a search page failed, a partial list would drop burials.
+# --------------------------------------------\
+def search_burial_urls(session, cemetery_id) :
+
+	# --- Vars. ---
+	search_url = find_a_grave + '/cemetery/' + cemetery_id + \
+		'/memorial-search?orderby=n'
+	max_pages = 500
+	page = 1
+	burial_urls = []
+	burial_ids = set()
+
+	# --- Loop index pages. ---
+	toolbox.print_l('Searching cemetery "' + cemetery_id + '" for burials ...')
+	while page < max_pages :
+
+		# --- Get index page. ---
+		request = toolbox.get_url(session, search_url + '&page=' + str(page))
+		if False == request :  # Retries ran out.
+			toolbox.print_l('Error: search page ' + str(page) + ' failed.')
+			return False
+		soup = make_soup(request.content)
+
+		# --- If last page, stop looping. ---
+		last_page = False
+		for warning in soup_find(soup, 'warnings') :  # Loop warnings.
+			if warning.parent.text.lower().find('no matches found') > 0 :
+				last_page = True  # No more pages.
+				break
+		if last_page or None == soup.find('div', {'class' : 'memorial-list-data'}) :
+			break
+
+		# --- Loop memorials. ---
+		memorials = soup_find(soup, 'memorials')
+		for memorial in memorials :
+			burial_url = find_a_grave + memorial.a['href'].split('?')[0]
+			if url_memorial_id(burial_url) not in burial_ids :
+				burial_ids.add(url_memorial_id(burial_url))
+				burial_urls.append(burial_url)
+		toolbox.print_l('  page ' + str(page) + ' has ' + str(len(memorials)) +
+			' memorials.')
+
+		page += 1  # Increment page.
+		pause_digging()  # Pace requests.
+
+	toolbox.print_l(str(len(burial_urls)) + ' burials found.')
+	return burial_urls
+# --------------------------------------------/
+
+
+# --------------------------------------------\
+#  Return the memorial ID of a memorial URL.
+#  Last update: 2026/10/18 @ 06:00pm.
+#
+#  e.g. "https://www.findagrave.com/memorial/123/john-doe" is "123".
+# --------------------------------------------\
+def url_memorial_id(url) :
+
+	# --- Return ID. ---
+	return url.split('/memorial/')[-1].split('/')[0]
+# --------------------------------------------/
+
+
+# --------------------------------------------\
+#  Compare two URL lists by memorial ID.
+#  Last update: 2026/10/18 @ 06:00pm.
+#
+#  Return [added, removed], URLs in new_urls only & in old_urls only.
+# --------------------------------------------\
+def diff_urls(old_urls, new_urls) :
+
+	# --- Vars. ---
+	old_ids = set(url_memorial_id(url) for url in old_urls)
+	new_ids = set(url_memorial_id(url) for url in new_urls)
+
+	# --- Compare. ---
+	added = [url for url in new_urls if url_memorial_id(url) not in old_ids]
+	removed = [url for url in old_urls if url_memorial_id(url) not in new_ids]
+	return [added, removed]
+# --------------------------------------------/
+
+
+# --------------------------------------------\
+#  Read a URL list file, return an array.
+#  Last update: 2026/10/18 @ 06:00pm.
+# --------------------------------------------\
+def read_url_list(path_to_list_file) :
+
+	# --- Read list. ---
+	if not os.path.isfile(path_to_list_file) :
+		return []
+	f = open(path_to_list_file, 'r')
+	urls = f.read().splitlines()
+	f.close()
+	return urls
+# --------------------------------------------/
+
+
+# --------------------------------------------\
+#  Write a URL list file.
+#  Last update: 2026/10/18 @ 06:00pm.
+# --------------------------------------------\
+def write_url_list(path_to_list_file, urls) :
 
+	# --- Write list (no dangling "\n"). ---
+	f = open(path_to_list_file, 'w')
+	f.write('\n'.join(urls))
+	f.close()
+# --------------------------------------------/
+
+
+# --------------------------------------------\
+#  Return the memorial IDs of pages stashed in a group folder.
+#  Last update: 2026/10/18 @ 06:00pm.
+# --------------------------------------------\
+def stashed_ids(path_to_group_folder) :
+
+	# --- Memorial IDs from file names. ---
+	mem_ids = set()
+	for file_name in os.listdir(path_to_group_folder) :
+		mem_ids.add(memorial_id(file_name))
+	return mem_ids
+# --------------------------------------------/
+
+
+# --------------------------------------------\
+#  Return the family URLs of every family group in a stashed page.
+#  Last update: 2026/10/18 @ 11:59pm.
+#
+#  Returns { group : [url, ...] } for family_groups, e.g. 'parent'.
+#  One parse for all groups, from get_facts(), so the links are cached
+#  with the page (fact cache) until the page changes.
+# --------------------------------------------\
+def page_family_urls(file_name) :
+
+	# --- Vars. ---
+	facts = get_facts(memorial_id(file_name), file_name)
+	family_urls = {}
+
+	# --- Loop family groups, e.g. 'parent' is in 'parents'. ---
+	for group in family_groups :
+		if 'burial' == group : continue
+		family_urls[group] = []
+		record_group = family_groups_names[family_groups_all.index(group)]
+		for person in facts['family'][record_group] :
+			if '' != person['url'] :  # Listed, but no memorial.
+				family_urls[group].append(find_a_grave + person['url'])
 	return family_urls
 # --------------------------------------------/
 
 
 # --------------------------------------------\
-#  Save (aka stash) a group page.
-#  Last update: 2024/06/09 @ 04:00pm.
+#  Stash family pages more than one hop from the burials.
+#  Last update: 2026/10/18 @ 11:59pm.
+#
+#  frontier = heap of [distance, order, url, page (no extension), burial
+#  url], stashed pages to expand. Burial family pages are distance 1.
+#  Every page stashed is recorded (crawled table) with the burial it was
+#  reached from, see remove_crawled_of().
+#  Closest pages are expanded first, a level at a time. Each page is read
+#  once for all family groups; new memorials (not in the master list)
+#  are stashed in their group folder, e.g. a parent's parent is saved as
+#  "<grandparent>_parent-of_<parent>". Pages closer than hops are expanded.
+#  Returns { group : [jobs, pages] } of the pages stashed.
 # --------------------------------------------\
-def stash_group_page(args) :
+def crawl_frontier(session, frontier, hops, groups, path_to_folder, fetchers,
+	cemetery_id) :
 
-	# --- Define vars. ---
-	global master_urls
-	session = args[0]
+	# --- Vars. ---
+	stashed = {}
+	for group in groups :
+		if 'burial' != group : stashed[group] = [[], []]
+	queued = set()  # Memorial IDs queued by the crawl.
+	order = len(frontier)
+
+	# --- Nearest level first. ---
+	while 0 != len(frontier) :
+		distance = frontier[0][0]
+		level = []
+		while 0 != len(frontier) and distance == frontier[0][0] :
+			level.append(heapq.heappop(frontier))
+		if distance >= hops : break
+		toolbox.print_l('Expanding ' + str(len(level)) + ' pages, ' + 
+			str(distance) + ' hops from burials.')
+
+		# --- Read each page once, queue new family. ---
+		jobs = {}
+		roots = {}  # Burial URL of each job.
+		for entry in level :
+			file_name = stash_file(entry[3])
+			if not os.path.isfile(file_name) : continue  # Failed fetch.
+			for group, family_urls in page_family_urls(file_name).items() :
+				if group not in stashed : continue
+				for family_url in family_urls :
+					family_id = url_memorial_id(family_url)
+					if is_master_url(family_url) or family_id in queued :
+						continue
+					queued.add(family_id)
+					jobs.setdefault(group, []).append([entry[2], family_url])
+					roots.setdefault(group, []).append(entry[4])
+
+		# --- Stash the next level. ---
+		for group in jobs :
+			pages = stash_group_pages(session, group, jobs[group], 
+				path_to_folder, fetchers, cemetery_id)
+			stashed[group][0] += jobs[group]
+			stashed[group][1] += pages
+			open_stash_db().executemany('INSERT OR REPLACE INTO crawled VALUES '
+				'(?, ?, ?, ?)', [(cemetery_id, group, pages[i],
+				roots[group][i].split('/memorial/')[1].replace('/', '_'))
+				for i in range(len(pages))])
+			for i in range(len(pages)) :
+				order += 1
+				heapq.heappush(frontier, [distance + 1, order, jobs[group][i][1],
+					pages[i], roots[group][i]])
+
+	return stashed
+# --------------------------------------------/
+
+
+# --------------------------------------------\
+#  Open the stash database.
+#  Last update: 2026/10/18 @ 05:00pm.
+#
+#  SQLite bookkeeping for stash_graves.py, next to the master index.
+#  validators = response validators for each stashed page (no extension).
+#  journal = crawl journal, queued/fetched/failed pages by cemetery & group.
+#  crawled = pages crawl_frontier() stashed & the burial (slug) they were
+#   reached from, so remove_crawled_of() can remove them with the burial.
+# --------------------------------------------\
+def open_stash_db() :
+
+	# --- Vars. ---
+	global stash_db
+
+	# --- Open (or create) database. ---
+	if None != stash_db :
+		return stash_db
+	stash_db = sqlite3.connect(path_to_stash + stash_db_name, timeout=30,
+		isolation_level=None)  # Autocommit.
+	stash_db.execute('PRAGMA journal_mode=WAL')
+	stash_db.execute('PRAGMA synchronous=NORMAL')
+	stash_db.execute('CREATE TABLE IF NOT EXISTS validators (page TEXT '
+		'PRIMARY KEY, url TEXT, etag TEXT, last_modified TEXT, sha256 TEXT)')
+	stash_db.execute('CREATE TABLE IF NOT EXISTS journal (cemetery TEXT, '
+		'grp TEXT, page TEXT, url TEXT, burial_url TEXT, state TEXT, '
+		'stamp TEXT, PRIMARY KEY (cemetery, grp, page))')
+	stash_db.execute('CREATE TABLE IF NOT EXISTS crawled (cemetery TEXT, '
+		'grp TEXT, page TEXT, burial TEXT, PRIMARY KEY (cemetery, grp, page))')
+	return stash_db
+# --------------------------------------------/
+
+
+# --------------------------------------------\
+#  Close the stash database.
+#  Last update: 2026/10/18 @ 05:00pm.
+# --------------------------------------------\
+def close_stash_db() :
+
+	# --- Vars. ---
+	global stash_db
+
+	# --- Close database. ---
+	if None != stash_db :
+		stash_db.close()
+		stash_db = None
+# --------------------------------------------/
+
+
+# --------------------------------------------\
+#  Return the stash file name (no extension) for a group page.
+#  Last update: 2026/10/18 @ 05:00pm.
+#
+#  args = [session, group, burial_url, family_url, path_to_folder]
+# --------------------------------------------\
+def group_page_name(args) :
+
+	# --- Vars. ---
 	group = args[1]
 	burial_url = args[2]
 	family_url = args[3]
 	path_to_folder = args[4]
-	if 'burial' == group :
-		url = burial_url
-	else :
-		url = family_url
 
-	# --- Request page. ---
-	request = toolbox.get_url(session, url)
-			
 	# --- Set the stash file name. ---
 	page = path_to_folder[group] + '\\'
 	burial_slug = burial_url.split('/memorial/')[1].replace('/', '_')
@@ -348,138 +737,1107 @@ def stash_group_page(args) :
 	else :
 		family_slug = family_url.split('/memorial/')[1].replace('/', '_')
 		page = page + family_slug + '_' + group + '-of_' + burial_slug
-	
-	# --- Stash the page. ---
-	f = open(page + '.html', 'w')
-	f.write(request.text)  # Stash page.
-	f.close()
+	return page
+# --------------------------------------------/
+
 
-	# --- Add URL to master_urls dynamic list (Recreated with each group). ---
+# --------------------------------------------\
+#  Return conditional request headers for an already stashed page.
+#  Last update: 2026/10/18 @ 05:00pm.
+#
+#  None if the page isn't stashed or has no validators.
+# --------------------------------------------\
+def page_validators(page) :
+
+	# --- Vars. ---
+	headers = {}
+
+	# --- Stashed page & validators? ---
+	if not os.path.isfile(stash_file(page)) :
+		return None
+	row = open_stash_db().execute('SELECT etag, last_modified FROM '
+		'validators WHERE page = ?', (page,)).fetchone()
+	if None == row :
+		return None
+	if None != row[0] : headers['If-None-Match'] = row[0]
+	if None != row[1] : headers['If-Modified-Since'] = row[1]
+	if 0 == len(headers) :
+		return None
+	return headers
+# --------------------------------------------/
+
+
+# --------------------------------------------\
+#  Save (aka stash) a group page.
+#  Last update: 2026/10/18 @ 11:59pm.
+#
+#  Return True if saved, False if the page could not be requested, or the
+#  status (404 or 410) of a page that is gone, see journal_page().
+# --------------------------------------------\
+def stash_group_page(args) :
+
+	# --- Define vars. ---
+	session = args[0]
+	group = args[1]
+	burial_url = args[2]
+	family_url = args[3]
 	if 'burial' == group :
-		master_urls.append(burial_url)
+		url = burial_url
 	else :
-		master_urls.append(family_url)
+		url = family_url
+
+	# --- Request (conditionally) & save page. ---
+	headers = page_validators(group_page_name(args))
+	request = toolbox.get_url(session, url, headers, True)
+	if False != request and int != type(request) :
+		save_group_page(args, request)
 
 	# --- Pace requests. ---
+	pause_digging()
+	if int == type(request) :  # Gone.
+		return request
+	return False != request
+# --------------------------------------------/
+
+
+# --------------------------------------------\
+#  Save (aka stash) a list of group pages.
+#  Last update: 2026/10/18 @ 07:00pm.
+#
+#  jobs = [[burial_url, family_url], ...], family_url is '' for burials.
+#  fetchers > 1 requests pages concurrently, paced by toolbox.set_rate().
+#  Pages are journaled (see journal_jobs()), so pages fetched by an
+#  interrupted run are skipped & failed pages are retried next run.
+#  Return the stash file names (no extension) of the pages.
+# --------------------------------------------\
+def stash_group_pages(session, group, jobs, path_to_folder, fetchers = 1,
+	cemetery_id = '') :
+
+	# --- Vars. ---
+	urls = []
+	pages = []
+	for job in jobs :
+		if 'burial' == group : urls.append(job[0])
+		else : urls.append(job[1])
+		pages.append(group_page_name([session, group, job[0], job[1], 
+			path_to_folder]))
+
+	# --- Journal: skip pages already fetched. ---
+	states = journal_jobs(cemetery_id, group, jobs, pages, urls)
+	todo = []
+	for i in range(len(jobs)) :
+		if 'fetched' == states.get(pages[i]) :
+			add_master_url(urls[i], path_to_folder[group] + '_list.txt')
+		else :
+			todo.append(i)
+	if len(todo) < len(jobs) :
+		toolbox.print_l('Resuming, ' + str(len(jobs) - len(todo)) + ' "' + 
+			group + '" pages already fetched.')
+	num_jobs = len(todo)
+
+	# --- One at a time. ---
+	if fetchers <= 1 :
+		for n in range(num_jobs) :
+			i = todo[n]
+			toolbox.print_l('Saving ' + str(n+1) + ' of ' + str(num_jobs) + 
+				' "' + group + '" pages - ' + urls[i])
+			args = [session, group, jobs[i][0], jobs[i][1], path_to_folder]
+			stashed = stash_group_page(args)
+			journal_page(cemetery_id, group, pages[i], stashed)
+		return pages
+
+	# --- Concurrent. ---
+	headers = []
+	for i in todo :
+		headers.append(page_validators(pages[i]))
+	responses = toolbox.get_urls(session, [urls[i] for i in todo], fetchers,
+		headers, True)
+	n = 0
+	for i, (url, request) in zip(todo, responses) :
+		n += 1
+		toolbox.print_l('Saving ' + str(n) + ' of ' + str(num_jobs) + 
+			' "' + group + '" pages - ' + url)
+		if int == type(request) :  # Gone.
+			journal_page(cemetery_id, group, pages[i], request)
+			continue
+		if False != request :
+			args = [session, group, jobs[i][0], jobs[i][1], path_to_folder]
+			save_group_page(args, request)
+		journal_page(cemetery_id, group, pages[i], False != request)
+	return pages
+# --------------------------------------------/
+
+
+# --------------------------------------------\
+#  Journal the pages queued for a group.
+#  Last update: 2026/10/18 @ 11:59pm.
+#
+#  Write-ahead: pages are "queued" before any are requested, then
+#  journal_page() marks each one "fetched", "failed" or "gone".
+#  Pages are remembered in journaled{}, see finish_journal().
+#  Return the journaled state of each page, { page : state }.
+# --------------------------------------------\
+def journal_jobs(cemetery_id, group, jobs, pages, urls) :
+
+	# --- Vars. ---
+	journal = open_stash_db()
+	rows = []
+	for i in range(len(jobs)) :
+		rows.append((cemetery_id, group, pages[i], urls[i], jobs[i][0]))
+		journaled.setdefault(cemetery_id, set()).add((group, pages[i]))
+
+	# --- States from an earlier (interrupted) run. ---
+	states = dict(journal.execute('SELECT page, state FROM journal WHERE '
+		'cemetery = ? AND grp = ?', (cemetery_id, group)).fetchall())
+
+	# --- Queue new pages. ---
+	journal.execute('BEGIN')
+	journal.executemany('INSERT OR IGNORE INTO journal VALUES (?, ?, ?, ?, ?, '
+		'\'queued\', datetime(\'now\'))', rows)
+	journal.execute('COMMIT')
+	return states
+# --------------------------------------------/
+
+
+# --------------------------------------------\
+#  Journal a page as fetched (or failed).
+#  Last update: 2026/10/18 @ 11:59pm.
+#
+#  fetched = True, False, or the status (404 or 410) of a page that is
+#  gone for good. "gone" pages aren't failures, see finish_journal().
+# --------------------------------------------\
+def journal_page(cemetery_id, group, page, fetched) :
+
+	# --- Vars. ---
+	state = 'failed'
+	if int == type(fetched) :  # Gone.
+		state = 'gone'
+		toolbox.print_l('  Gone (' + str(fetched) + '), not retried.')
+	elif fetched :
+		state = 'fetched'
+	else :
+		toolbox.print_l('  Failed, will retry next run.')
+
+	# --- Update journal. ---
+	open_stash_db().execute('UPDATE journal SET state = ?, '
+		'stamp = datetime(\'now\') WHERE cemetery = ? AND grp = ? AND '
+		'page = ?', (state, cemetery_id, group, page))
+# --------------------------------------------/
+
+
+# --------------------------------------------\
+#  Finish a cemetery's crawl journal.
+#  Last update: 2026/10/18 @ 11:59pm.
+#
+#  Pages no job asked for this run (e.g. a removed burial or a changed
+#  family link) are dropped first, they'd never be fetched.
+#  With no failed pages ("gone" pages don't count) the journal is cleared,
+#  so the next run is a full refresh. Otherwise it's kept & the next run resumes. Return # failed.
+# --------------------------------------------\
+def finish_journal(cemetery_id) :
+
+	# --- Vars. ---
+	journal = open_stash_db()
+	current = journaled.pop(cemetery_id, set())
+
+	# --- Drop pages no longer wanted. ---
+	rows = journal.execute('SELECT grp, page FROM journal WHERE cemetery = ?',
+		(cemetery_id,)).fetchall()
+	journal.execute('BEGIN')
+	for group, page in rows :
+		if (group, page) not in current :
+			journal.execute('DELETE FROM journal WHERE cemetery = ? AND '
+				'grp = ? AND page = ?', (cemetery_id, group, page))
+	journal.execute('COMMIT')
+
+	# --- Count failures, clear if none. ---
+	failed = journal.execute('SELECT COUNT(*) FROM journal WHERE cemetery = ? '
+		'AND state NOT IN (\'fetched\', \'gone\')', (cemetery_id,)).fetchone()[0]
+	if 0 == failed :
+		journal.execute('DELETE FROM journal WHERE cemetery = ?', 
+			(cemetery_id,))
+	return failed
+# --------------------------------------------/
+
+
+# --------------------------------------------\
+#  Write a requested group page to the stash.
+#  Last update: 2026/10/18 @ 05:00pm.
+#
+#  A 304 (not modified) response, or a page with the same content hash,
+#  keeps the stashed file as is. Validators are saved for next time.
+# --------------------------------------------\
+def save_group_page(args, request) :
+
+	# --- Define vars. ---
+	group = args[1]
+	burial_url = args[2]
+	family_url = args[3]
+	path_to_folder = args[4]
+	page = group_page_name(args)
+	stash = open_stash_db()
+	if 'burial' == group :
+		url = burial_url
+	else :
+		url = family_url
+
+	# --- Stash the page, if changed. ---
+	if 304 == request.status_code :
+		toolbox.print_l('  Not modified.')
+	else :
+		sha256 = hashlib.sha256(request.content).hexdigest()
+		row = stash.execute('SELECT sha256 FROM validators WHERE page = ?',
+			(page,)).fetchone()
+		if None == row or sha256 != row[0] or \
+			not os.path.isfile(stash_file(page)) :
+			write_page(page, request.text)  # Stash page.
+		stash.execute('INSERT OR REPLACE INTO validators VALUES (?, ?, ?, ?, ?)',
+			(page, url, request.headers.get('ETag'), 
+			request.headers.get('Last-Modified'), sha256))
+
+	# --- Add URL to master list. ---
+	add_master_url(url, path_to_folder[group] + '_list.txt')
 	if 'burial' != group :
 		toolbox.print_l('  ' + group + ' = "' + family_url + '"')
-	pause_digging()
+# --------------------------------------------/
+
+
+# --------------------------------------------\
+#  Return the stashed file name for a page (no extension).
+#  Last update: 2026/10/18 @ 09:00pm.
+#
+#  "page.html" (a file) or "page.ref" (a reference into the page store).
+#  Defaults to "page.html" if the page isn't stashed.
+# --------------------------------------------\
+def stash_file(page) :
+
+	# --- Which file exists? ---
+	if os.path.isfile(page + '.ref') :
+		return page + '.ref'
+	return page + '.html'
+# --------------------------------------------/
+
+
+# --------------------------------------------\
+#  Write a stashed page, return its file name.
+#  Last update: 2026/10/18 @ 09:00pm.
+#
+#  "page_store : files" (default) writes "page.html".
+#  "page_store : cas" stores the page body once in the page store,
+#  compressed (zstd if installed, else gzip) & named by its sha256 hash.
+#  The group folder then holds a small "page.ref" with the hash & codec.
+# --------------------------------------------\
+def write_page(page, text) :
+
+	# --- Plain file. ---
+	if 'cas' != toolbox.get_option('page_store', 'files') :
+		f = open(page + '.html', 'w')
+		f.write(text)
+		f.close()
+		if os.path.isfile(page + '.ref') : os.remove(page + '.ref')
+		return page + '.html'
+
+	# --- Page store. ---
+	body = text.encode('utf8')
+	sha256 = hashlib.sha256(body).hexdigest()
+	codec = 'gz'
+	if None != zstandard : codec = 'zst'
+	blob = blob_name(sha256, codec)
+	if not os.path.isfile(blob) :  # Each unique body is stored once.
+		os.makedirs(blob.rsplit('\\', 1)[0], exist_ok = True)
+		if 'zst' == codec : body = zstandard.ZstdCompressor().compress(body)
+		else : body = gzip.compress(body)
+		f = open(blob + '.tmp', 'wb')
+		f.write(body)
+		f.close()
+		os.replace(blob + '.tmp', blob)
+
+	# --- Reference. ---
+	f = open(page + '.ref', 'w')
+	f.write(sha256 + ' ' + codec)
+	f.close()
+	if os.path.isfile(page + '.html') : os.remove(page + '.html')
+	return page + '.ref'
+# --------------------------------------------/
+
+
+# --------------------------------------------\
+#  Read a stashed page (file or page store reference), return its text.
+#  Last update: 2026/10/18 @ 09:00pm.
+# --------------------------------------------\
+def read_page(file_name) :
+
+	# --- Plain file. ---
+	if not file_name.endswith('.ref') :
+		f = open(file_name, 'r', encoding = 'utf8')
+		text = f.read()
+		f.close()
+		return text
+
+	# --- Page store. ---
+	f = open(file_name, 'r')
+	sha256, codec = f.read().split()
+	f.close()
+	f = open(blob_name(sha256, codec), 'rb')
+	body = f.read()
+	f.close()
+	if 'zst' == codec :
+		if None == zstandard :
+			toolbox.print_l('Error: "' + file_name + '" needs zstandard.')
+			quit()
+		body = zstandard.ZstdDecompressor().decompress(body)
+	else :
+		body = gzip.decompress(body)
+	return body.decode('utf8')
+# --------------------------------------------/
+
+
+# --------------------------------------------\
+#  Return the page store file name for a page body hash.
+#  Last update: 2026/10/18 @ 09:00pm.
+# --------------------------------------------\
+def blob_name(sha256, codec) :
+
+	# --- e.g. "pages\ab\ab12...ef.html.gz". ---
+	return path_to_stash + page_store_folder + '\\' + sha256[:2] + '\\' + \
+		sha256 + '.html.' + codec
+# --------------------------------------------/
+
+
+# --------------------------------------------\
+#  Remove page store bodies no page references.
+#  Last update: 2026/10/18 @ 09:00pm.
+#
+#  Return the number of bodies removed.
+# --------------------------------------------\
+def sweep_page_store() :
+
+	# --- Vars. ---
+	referenced = set()
+	removed = 0
+	store = path_to_stash + page_store_folder
+	if not os.path.isdir(store) :
+		return 0
+
+	# --- Referenced hashes, from all group folders. ---
+	for cemetery_folder in glob.glob(path_to_stash + '/*_*/') :
+		for group_folder in glob.glob(cemetery_folder + '*_*/') :
+			for entry in os.scandir(group_folder) :
+				if entry.name.endswith('.ref') :
+					f = open(entry.path, 'r')
+					referenced.add(f.read().split()[0])
+					f.close()
+
+	# --- Remove the rest. ---
+	for folder in os.scandir(store) :
+		for entry in os.scandir(folder.path) :
+			if entry.name.split('.')[0] not in referenced :
+				os.remove(entry.path)
+				removed += 1
+	return removed
+# --------------------------------------------/
+
+
+# --------------------------------------------\
+#  Remove stashed pages a group no longer has.
+#  Last update: 2026/10/18 @ 06:00pm.
+#
+#  pages = stash file names (no extension) to keep.
+#  Return the removed file names.
+# --------------------------------------------\
+def remove_stale_pages(path_to_group_folder, pages) :
+
+	# --- Vars. ---
+	keep = set(pages)
+	removed = []
+
+	# --- Remove pages not kept. ---
+	for file_name in os.listdir(path_to_group_folder) :
+		page = path_to_group_folder + '\\' + file_name.rsplit('.', 1)[0]
+		if page not in keep :
+			removed.append(remove_page(path_to_group_folder + '\\' + 
+				file_name))
+
+	return removed
+# --------------------------------------------/
+
+
+# --------------------------------------------\
+#  Remove pages stashed for removed burials.
+#  Last update: 2026/10/18 @ 06:00pm.
+#
+#  Burial pages are "burial-slug.html", family pages end with
+#  "-of_burial-slug.html". Return the removed file names.
+# --------------------------------------------\
+def remove_pages_of(path_to_group_folder, group, burial_urls) :
+
+	# --- Vars. ---
+	slugs = set()
+	removed = []
+	for burial_url in burial_urls :
+		slugs.add(burial_url.split('/memorial/')[1].replace('/', '_'))
+
+	# --- Remove matching pages. ---
+	for file_name in os.listdir(path_to_group_folder) :
+		stem = file_name.rsplit('.', 1)[0]
+		if 'burial' != group :
+			stem = stem.split('-of_', 1)[-1]
+		if stem in slugs :
+			removed.append(remove_page(path_to_group_folder + '\\' + 
+				file_name))
+
+	return removed
+# --------------------------------------------/
+
+
+# --------------------------------------------\
+#  Remove the crawled pages (family of family) reached from burials.
+#  Last update: 2026/10/18 @ 11:59pm.
+#
+#  remove_pages_of() only finds "<id>_<group>-of_<burial>" pages, pages
+#  crawl_frontier() stashed further out are "-of_<family member>".
+#  Return the file names removed.
+# --------------------------------------------\
+def remove_crawled_of(cemetery_id, group, burial_urls) :
+
+	# --- Vars. ---
+	stash = open_stash_db()
+	removed = []
+	slugs = set()
+	for burial_url in burial_urls :
+		slugs.add(burial_url.split('/memorial/')[1].replace('/', '_'))
+
+	# --- Remove pages reached from those burials. ---
+	rows = stash.execute('SELECT page, burial FROM crawled WHERE cemetery = ? '
+		'AND grp = ?', (cemetery_id, group)).fetchall()
+	for page, burial in rows :
+		if burial not in slugs : continue
+		file_name = stash_file(page)
+		if os.path.isfile(file_name) :
+			removed.append(remove_page(file_name))
+		stash.execute('DELETE FROM crawled WHERE cemetery = ? AND grp = ? AND '
+			'page = ?', (cemetery_id, group, page))
+
+	return removed
+# --------------------------------------------/
+
+
+# --------------------------------------------\
+#  Remove a stashed page & its validators.
+#  Last update: 2026/10/18 @ 06:00pm.
+# --------------------------------------------\
+def remove_page(file_name) :
+
+	# --- Remove file & validators. ---
+	os.remove(file_name)
+	open_stash_db().execute('DELETE FROM validators WHERE page = ?', 
+		(file_name.rsplit('.', 1)[0],))
+	return file_name
 # --------------------------------------------/
 
 
 # --------------------------------------------\
 #  Random sleep when requesting web pages.
-#  Last update: 2024/06/03 @ 08:45am.
+#  Last update: 2026/10/18 @ 11:59pm.
+#
+#  Low & high are seconds. No sleep with the adaptive pacer on, get_url()
+#  already waits its turn, see toolbox.set_pacer().
 # --------------------------------------------\
-def pause_digging() :
+def pause_digging(low:float = 0.5, high:float = 1) :
+
+	# --- Paced by get_url()? ---
+	if toolbox.pacer['on'] :
+		return
 
 	# --- Pause. ---
-	toolbox.pause(0.5,1,True)
+	toolbox.pause(low,high,True)
 # --------------------------------------------/
 
 
 # --------------------------------------------\
 #  Prevent duplicating stashed pages.
-#  Last update: 2024/06/10 @ 09:00am.
+#  Last update: 2026/10/18 @ 08:00pm.
 #
-#  Create a list of all URLs for all cemeteries in this collection
+#  Create an index of all URLs for all cemeteries in this collection
 #  1. For "path_to_stash" (aka collection), find all cemetery folders
-#  2. Combine all group lists from all cemetery folders into a master list 
-#  3. Master list is a snapshot of all URLs at _this_ point in time.
+#  2. Combine all group lists from all cemetery folders into a master index
+#  3. Built once per run, then kept up to date by add_master_url() &
+#     forget_master_ids() as groups are stashed.
 #
-#  global master_urls[] is master list until saved by write_master_list().
+#  URLs are keyed by memorial ID, so lookups are O(1) & slug or query
+#  string differences don't matter.
+#  global master_urls{} is master list until saved by save_master_list().
 # --------------------------------------------\
 def build_master_list() :
 
 	# --- Define vars. ---
-	global master_urls
+	global master_urls, master_ids
 	cemetery_folders = glob.glob(path_to_stash + '/*_*/')
 
-	# --- Build a master list of all group lists. ---
-	master_urls = []  # New list.
+	# --- Build a master index of all group lists. ---
+	master_urls = {}  # New index.
+	master_ids = {}
 	for cemetery_folder in cemetery_folders :
 		cemetery_id = cemetery_folder.split(path_to_stash)[1].split('_')[0]
 		for group_name in family_groups_names :
 			folder_name = cemetery_folder + cemetery_id + '_' + group_name
 			list_name = folder_name + '_list.txt'
-			if os.path.isfile(list_name) :
-				f = open(list_name, 'r')
-				urls = f.read().splitlines()
-				f.close
-				master_urls += urls
+			for url in read_url_list(list_name) :
+				add_master_url(url, list_name)
 
 	return master_urls
 # --------------------------------------------/
 
 
 # --------------------------------------------\
-#  Write master list of URLs.
-#  Last update: 2024/06/10 @ 09:00am.
+#  Return a canonical memorial URL.
+#  Last update: 2026/10/18 @ 08:00pm.
+#
+#  e.g. "http://findagrave.com/memorial/123/john-doe/?x=1" is
+#  "https://www.findagrave.com/memorial/123/john-doe".
+# --------------------------------------------\
+def canonical_url(url) :
+
+	# --- Vars. ---
+	path = url.split('/memorial/')[-1].split('?')[0].split('#')[0]
+
+	# --- Return URL. ---
+	return fag_prefix + path.rstrip('/')
+# --------------------------------------------/
+
+
+# --------------------------------------------\
+#  Is a memorial URL in the master list?
+#  Last update: 2026/10/18 @ 08:00pm.
+# --------------------------------------------\
+def is_master_url(url) :
+
+	# --- Look up memorial ID. ---
+	return url_memorial_id(url) in master_ids
+# --------------------------------------------/
+
+
+# --------------------------------------------\
+#  Add a memorial URL to the master list.
+#  Last update: 2026/10/18 @ 08:00pm.
+#
+#  list_name = the group list file the URL belongs to.
+# --------------------------------------------\
+def add_master_url(url, list_name) :
+
+	# --- Vars. ---
+	mem_id = url_memorial_id(url)
+	list_name = list_name.replace('\\', '/').rsplit('/', 1)[-1]
+
+	# --- Add. ---
+	if mem_id not in master_urls :
+		master_urls[mem_id] = canonical_url(url)
+	master_ids.setdefault(mem_id, set()).add(list_name)
+# --------------------------------------------/
+
+
+# --------------------------------------------\
+#  Remove memorial IDs of a group list from the master list.
+#  Last update: 2026/10/18 @ 08:00pm.
+#
+#  Used when a group list is rebuilt (or pages are removed). An ID stays
+#  while another group list still has it.
+# --------------------------------------------\
+def forget_master_ids(list_name, mem_ids) :
+
+	# --- Vars. ---
+	list_name = list_name.replace('\\', '/').rsplit('/', 1)[-1]
+
+	# --- Forget. ---
+	for mem_id in mem_ids :
+		if mem_id in master_ids :
+			master_ids[mem_id].discard(list_name)
+			if 0 == len(master_ids[mem_id]) :
+				del master_ids[mem_id]
+				del master_urls[mem_id]
+# --------------------------------------------/
+
+
+# --------------------------------------------\
+#  Write master list of URLs.
+#  Last update: 2026/10/18 @ 08:00pm.
+# --------------------------------------------\
+def save_master_list() :
+
+	# --- Save the master list. --
+	f = open(path_to_stash + master_list, 'w')
+	for url in master_urls.values() :
+		f.write(url + '\n')
+	f.close()
+# --------------------------------------------/
+
+# --------------------------------------------\
+#  Return the memorial ID for a stashed file name.
+#  Last update: 2026/10/18 @ 09:30am.
+#
+#  Stashed file names start with the memorial ID, e.g.
+#  "123_john-doe.html" or "456_jane-doe_parent-of_123_john-doe.html".
+# --------------------------------------------\
+def memorial_id(file_name) :
+
+	# --- Vars. ---
+	base_name = file_name.replace('\\', '/').rsplit('/', 1)[-1]
+
+	# --- Return ID. ---
+	return base_name.split('_')[0]
+# --------------------------------------------/
+
+
+# --------------------------------------------\
+#  Return a master index line for a stashed file name.
+#  Last update: 2026/10/18 @ 09:30am.
+#
+#  Line parts are [memorial id, cemetery id, group, file name].
+#  Group folders are named "cemetery-id_group-name", e.g. "123_parents".
+# --------------------------------------------\
+def index_line(file_name) :
+
+	# --- Vars. ---
+	file_name = file_name.rstrip('\n')
+	folder = file_name.replace('\\', '/').rstrip('/').rsplit('/', 2)[-2]
+	cemetery_id = folder.split('_')[0]
+	group_name = folder.split('_', 1)[-1]
+	group = ''
+
+	# --- Group name to group. ---
+	if group_name in family_groups_names :
+		group = family_groups_all[family_groups_names.index(group_name)]
+
+	return [memorial_id(file_name), cemetery_id, group, file_name]
+# --------------------------------------------/
+
+
+# --------------------------------------------\
+#  Build a master index of all file names.
+#  Last update: 2026/10/18 @ 09:00pm.
+#
+#  Create an index of all stashed files for all cemeteries in this collection
+#  1. For "path_to_stash" (aka collection), find all cemetery folders
+#  2. Combine all group file names from all cemetery folders into a master index 
+#  3. Master index is a snapshot of all file names at _this_ point in time
+#  4. Master index parallels master list created by build_master_list().
+#  5. Each line is "memorial id, cemetery id, group, file name" (tab separated).
+# --------------------------------------------\
+def build_master_index() :
+
+	# --- Define vars. ---
+	cemetery_folders = glob.glob(path_to_stash + '/*_*/')
+	f = open(path_to_stash + master_index, 'w')
+
+	# --- Build a master index of all group file names. ---
+	for cemetery_folder in cemetery_folders :
+		cemetery_id = cemetery_folder.split(path_to_stash)[1].split('_')[0]
+		for group_name in family_groups_names :
+			path_to_group_folder = cemetery_folder + cemetery_id + '_' + group_name
+			if os.path.exists(path_to_group_folder) :  # Does folder exist?
+				for entry in os.scandir(path_to_group_folder) :
+					file_name = path_to_group_folder + '\\' + entry.name
+					f.write('\t'.join(index_line(file_name)) + '\n')
+	f.close()
+	
+	# Remove dangling "\n".
+	toolbox.remove_last_byte(f, path_to_stash + master_index)
+# --------------------------------------------/
+
+
+# --------------------------------------------\
+#  Update the master index in place.
+#  Last update: 2026/10/18 @ 06:00pm.
+#
+#  Used by incremental stashing instead of re-listing every folder.
+#  added_files & removed_files are stashed file names.
+# --------------------------------------------\
+def update_master_index(added_files, removed_files) :
+
+	# --- No index yet? Build one. ---
+	if not os.path.exists(path_to_stash + master_index) :
+		build_master_index()
+		return
+
+	# --- Vars. ---
+	removed = set(removed_files)
+	f = open(path_to_stash + master_index, 'r')
+	lines = f.read().splitlines()
+	f.close()
+
+	# --- Drop removed, add new. ---
+	index = []
+	indexed = set()
+	for line in lines :
+		file_name = line.split('\t')[-1]
+		if file_name not in removed :
+			index.append(line)
+			indexed.add(file_name)
+	for file_name in added_files :
+		if file_name not in indexed and os.path.isfile(file_name) :
+			index.append('\t'.join(index_line(file_name)))
+			indexed.add(file_name)
+
+	# --- Save index. ---
+	f = open(path_to_stash + master_index, 'w')
+	f.write('\n'.join(index))
+	f.close()
+# --------------------------------------------/
+
+
+# --------------------------------------------\
+#  Read the master file index.
+#  Last update: 2026/10/18 @ 09:30am.
+#
+#  global master_file_index{} is keyed by memorial ID.
+#  e.g. { '123' : {'file' : ..., 'cemetery' : '456', 'group' : 'burial'} }
+#  The first file found for a memorial wins (burials are indexed first).
+# --------------------------------------------\
+def read_master_index() :
+
+	# --- Vars. ---
+	global master_file_index
+	master_file_index = {}
+
+	# --- Read master file index. ---
+	if os.path.exists(path_to_stash + master_index) :  # Does index file exist?
+		f = open(path_to_stash + master_index, 'r')
+		lines = f.read().splitlines()
+		f.close()
+	else : 
+		toolbox.print_l('Error: master index file does not exist.')
+		quit()
+
+	# --- Key file names by memorial ID. ---
+	for line in lines :
+		parts = line.split('\t')
+		if 4 != len(parts) :  # Older index, file names only.
+			parts = index_line(line)
+		if parts[0] not in master_file_index :
+			master_file_index[parts[0]] = {
+				'file' : parts[3],
+				'cemetery' : parts[1],
+				'group' : parts[2]
+			}
+# --------------------------------------------/
+
+
+# --------------------------------------------\
+#  Open the memorial fact cache.
+#  Last update: 2026/10/18 @ 11:59pm.
+#
+#  SQLite database next to the master index. One row per memorial ID,
+#  stamped with the stashed file's mtime & size so edits invalidate it,
+#  & the parse that made it (see get_facts()), so parsers never mix.
+#  photographers = profile photo credit by memorial ID (NULL = no photo),
+#   fetched = when the page it came from was fetched, see search_memorials.py.
+# --------------------------------------------\
+def open_fact_cache() :
+
+	# --- Vars. ---
+	global fact_cache
+
+	# --- Open (or create) cache. ---
+	if None != fact_cache :
+		return fact_cache
+	fact_cache = sqlite3.connect(path_to_stash + fact_cache_db, timeout=30,
+		isolation_level=None)  # Autocommit.
+	fact_cache.execute('PRAGMA journal_mode=WAL')
+	fact_cache.execute('PRAGMA synchronous=NORMAL')
+	version = fact_cache.execute('PRAGMA user_version').fetchone()[0]
+	if fact_cache_version != version :  # Stale facts, start over.
+		fact_cache.execute('DROP TABLE IF EXISTS facts')
+		fact_cache.execute('DROP TABLE IF EXISTS photographers')
+		fact_cache.execute('PRAGMA user_version=' + str(fact_cache_version))
+	fact_cache.execute('CREATE TABLE IF NOT EXISTS facts (id TEXT PRIMARY KEY,'
+		' mtime REAL, size INTEGER, parser TEXT, facts TEXT)')
+	fact_cache.execute('CREATE TABLE IF NOT EXISTS photographers (id TEXT '
+		'PRIMARY KEY, photographer TEXT, fetched REAL)')  # search_memorials.py
+	return fact_cache
+# --------------------------------------------/
+
+
+# --------------------------------------------\
+#  Close the memorial fact cache.
+#  Last update: 2026/10/18 @ 11:00am.
+# --------------------------------------------\
+def close_fact_cache() :
+
+	# --- Vars. ---
+	global fact_cache
+
+	# --- Close cache. ---
+	if None != fact_cache :
+		fact_cache.close()
+		fact_cache = None
+# --------------------------------------------/
+
+
+# --------------------------------------------\
+#  Return parsed facts for a stashed memorial page.
+#  Last update: 2026/10/18 @ 11:59pm.
+#
+#  Checked in order: this run (fact_memo), fact cache, stashed page.
+#  A page is only parsed when its mtime/size (or the parser, e.g. "lxml" or
+#  "lxml partial") differ from the cached copy.
+# --------------------------------------------\
+def get_facts(mem_id, file_name) :
+
+	# --- Vars. ---
+	stat = os.stat(file_name)
+	stamp = (stat.st_mtime, stat.st_size)
+	partial = toolbox.get_option('partial_parse', False)
+	parser = parser_name()
+	if partial : parser += ' partial'
+
+	# --- Already seen this run? ---
+	if mem_id in fact_memo and stamp == fact_memo[mem_id][0] :
+		return fact_memo[mem_id][1]
+
+	# --- Cached from an earlier run? ---
+	cache = open_fact_cache()
+	row = cache.execute('SELECT mtime, size, parser, facts FROM facts WHERE '
+		'id = ?', (mem_id,)).fetchone()
+	if None != row and (stamp[0], stamp[1], parser) == (row[0], row[1], row[2]) :
+		facts = json.loads(row[3])
+	else :
+		# Make soup, extract & cache.
+		soup = make_soup(read_page(file_name), '', partial)
+		facts = extract_memorial(soup)
+		cache.execute('INSERT OR REPLACE INTO facts VALUES (?, ?, ?, ?, ?)',
+			(mem_id, stamp[0], stamp[1], parser, json.dumps(facts)))
+
+	fact_memo[mem_id] = (stamp, facts)
+	return facts
+# --------------------------------------------/
+
+
+# --------------------------------------------\
+#  Extract a memorial record from memorial page soup.
+#  Last update: 2026/10/18 @ 01:30pm.
+#
+#  Walk the document once, keeping the elements every column needs, then
+#  build a record (dictionary) keyed by row_data names. e.g.
+#  record['birth'] = '1 Jan 1900'
+#  record['family']['parents'] = [{id, url, name, birth, death}, ...]
+#  Records are plain data so they can be cached (json) & pickled.
+# --------------------------------------------\
+def extract_memorial(soup) :
+
+	# --- Vars. ---
+	found = {}  # First element found for each memorial_ids id.
+	lists = {}  # Family list elements by family group.
+	canonical = None
+	record = {}
+
+	# --- Walk the document once. ---
+	record['veteran'] = ''
+	for tag in soup.find_all(True) :
+		tag_id = tag.get('id')
+		if tag_id in memorial_ids and tag_id not in found :
+			found[tag_id] = tag
+		label = tag.get('aria-labelledby')
+		if label in family_labels :
+			lists.setdefault(family_labels[label], []).append(tag)
+		if None == canonical and 'link' == tag.name and \
+			'canonical' in tag.get('rel', []) :
+			canonical = tag
+		if '' == record['veteran'] and 'icon-vet' in tag.get('class', []) \
+			and None != tag.find_parent('h1') :
+			record['veteran'] = 'Y'
+
+	# --- Text values. ---
+	for key, tag_id in memorial_text_ids.items() :
+		item = found.get(tag_id)
+		if None == item : record[key] = ''
+		else : record[key] = toolbox.clean_string(item.text)
+	for key, tag_id in memorial_markup_ids.items() :
+		item = found.get(tag_id)
+		if None == item : record[key] = ''
+		else : record[key] = toolbox.clean_string(str(item))
+	# Remove (aged 9 months), ...
+	record['death'] = re.sub('[ ][(].*?[)].*', '', record['death'])
+
+	# --- Name & surname. ---
+	item = found.get('bio-name')
+	if None == item : record['name'] = ''
+	else :  # Remove veteran label.
+		record['name'] = toolbox.clean_string(item.text.replace('VVeteran', ''))
+	if None == canonical : record['url'] = ''
+	else : record['url'] = canonical.get('href', '')
+	parts = re.split('-|_', record['url'].split('/')[-1])  # '-' or '_'.
+	record['surname'] = unquote(parts[-1].capitalize())
+
+	# --- Cemetery & cenotaph. ---
+	item = found.get('cemeteryNameLabel')
+	if None == item : record['cemetery'] = ''
+	else : record['cemetery'] = item.parent.get('href', '')
+	item = found.get('cemeteryLabel')
+	record['cenotaph'] = ''
+	if None != item and 'cenotaph' == item.text.lower() :
+		record['cenotaph'] = 'Y'
+
+	# --- Google map, latitude & longitude. ---
+	item = found.get('gpsValue')
+	record['google_map'] = ''
+	if None != item and -1 == item.get('href', 'edit#').find('edit#') :
+		record['google_map'] = item.get('href')
+	record['latitude'] = lat_long('lat', record['google_map'])
+	record['longitude'] = lat_long('long', record['google_map'])
+
+	# --- Family groups. ---
+	record['family'] = {}
+	for group in family_labels.values() :
+		record['family'][group] = []
+		for family_list in lists.get(group, []) :
+			for person in list_names(family_list) :
+				record['family'][group].append(family_member(person))
+	record['parents_surname'] = parent_surname(record)
+
+	return record
+# --------------------------------------------/
+
+
+# --------------------------------------------\
+#  Return a family member from a family list name element.
+#  Last update: 2026/10/18 @ 01:30pm.
+# --------------------------------------------\
+def family_member(person) :
+
+	# --- Vars. ---
+	member = {}
+
+	# --- Fill the member. ---
+	member['name'] = toolbox.clean_string(person.text)
+	member['url'] = person.parent.parent.get('data-href', '')
+	if '' == member['url'] : member['id'] = ''
+	else : member['id'] = member['url'].split('/')[2]
+	item = person.parent.find(id='familyBirthLabel')
+	if None == item : member['birth'] = ''
+	else : member['birth'] = toolbox.clean_string(item.text)
+	item = person.parent.find(id='familyDeathLabel')
+	if None == item : member['death'] = ''
+	else : member['death'] = toolbox.clean_string(item.text)
+
+	return member
+# --------------------------------------------/
+
+
+# --------------------------------------------\
+#  Return the cemetery ("#id_slug") of a family member.
+#  Last update: 2026/10/18 @ 11:30pm.
+# --------------------------------------------\
+def member_cemetery(mem_id) :
+
+	# --- Look up memorial ID in master file index. ---
+	entry = master_file_index.get(mem_id)
+	if None == entry :
+		toolbox.print_l('Error: Missing memorial ' + mem_id +
+			' in master file index.' )
+		return '** missing **'
+
+	# --- Get cemetery ID for this person. ---
+	# Facts if already parsed, else scan the page for the cemetery link.
+	cemetery = '#unknown'
+	if mem_id in fact_memo :
+		cemetery_string = fact_memo[mem_id][1]['cemetery']
+	else :
+		cemetery_string = find_cemetery(entry['file'])
+	if None == cemetery_string :  # Unexpected markup, parse it.
+		cemetery_string = get_facts(mem_id, entry['file'])['cemetery']
+	if '' != cemetery_string :
+		cemetery_string = cemetery_string.split('/cemetery/')[1]
+		cemetery = '#' + cemetery_string.replace('/', '_')
+	return cemetery
+# --------------------------------------------/
+
+
+# --------------------------------------------\
+#  Return the cemetery link of a stashed page, without parsing it.
+#  Last update: 2026/10/18 @ 11:30pm.
+#
+#  Same value as extract_memorial() record['cemetery'], the href of the
+#  link around cemeteryNameLabel. e.g. '/cemetery/2353265/sherrill-pres'
+#  Scans the file bytes (mmap) for the label & the link tag right before it.
+#  '' = no cemetery label, None = label found but no link, parse instead.
 # --------------------------------------------\
-def save_master_list() :
+def find_cemetery(file_name) :
 
-	# --- Save the master list. --
-	f = open(path_to_stash + master_list, 'w')
-	for url in master_urls :
-		f.write(url + '\n')
-	f.close()
+	# --- Vars. ---
+	data = b''
+
+	# --- Page bytes. ---
+	if file_name.endswith('.ref') :
+		data = read_page(file_name).encode('utf8')
+	elif os.path.getsize(file_name) > 0 :
+		f = open(file_name, 'rb')
+		data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+		f.close()
+
+	# --- Find the label, then its link. ---
+	href = ''
+	found = cemetery_label.search(data)
+	if None != found :
+		start = data.rfind(b'<', 0, found.start())  # Label tag.
+		link = cemetery_link.search(data[max(0, start - 1000) : start])
+		if None == link : href = None
+		else : href = html.unescape(link.group(1).decode('utf8'))
+	if isinstance(data, mmap.mmap) : data.close()
+	return href
 # --------------------------------------------/
 
+
 # --------------------------------------------\
-#  Build a master index of all file names.
-#  Last update: 2024/06/09 @ 04:30pm.
+#  Return the memorial record for a stashed burial file.
+#  Last update: 2026/10/18 @ 11:59pm.
 #
-#  Create an index of all stashed files for all cemeteries in this collection
-#  1. For "path_to_stash" (aka collection), find all cemetery folders
-#  2. Combine all group file names from all cemetery folders into a master index 
-#  3. Master index is a snapshot of all file names at _this_ point in time
-#  4. Master index parallels master list created by build_master_list().
+#  Adds record['cemeteries'], family member cemeteries by memorial ID.
+#  A page without a memorial ID label gets the ID from its file name.
+#  No spreadsheet formats needed, safe to run in a worker process.
 # --------------------------------------------\
-def build_master_index() :
-
-	# --- Define vars. ---
-	cemetery_folders = glob.glob(path_to_stash + '/*_*/')
-	f = open(path_to_stash + master_index, 'w')
+def dig_record(burial_file_name) :
 
-	# --- Build a master index of all group file names. ---
-	for cemetery_folder in cemetery_folders :
-		cemetery_id = cemetery_folder.split(path_to_stash)[1].split('_')[0]
-		for group_name in family_groups_names :
-			path_to_group_folder = cemetery_folder + cemetery_id + '_' + group_name
-			if os.path.exists(path_to_group_folder) :  # Does folder exist?
-				file_names = glob.glob(path_to_group_folder + '/*')
-				for file_name in file_names :
-					f.write(file_name + '\n')
-	f.close()
-	
-	# Remove dangling "\n".
-	toolbox.remove_last_byte(f, path_to_stash + master_index)
+	# --- Vars. ---
+	facts = get_facts(memorial_id(burial_file_name), burial_file_name)
+	record = dict(facts)  # Don't change the cached copy.
+	record['cemeteries'] = {}
+	if '' == record['id'] :  # No memNumberLabel.
+		record['id'] = memorial_id(burial_file_name)
+
+	# --- Family member cemeteries. ---
+	for group in record['family'] :
+		for person in record['family'][group] :
+			if person['id'] not in record['cemeteries'] :
+				cemetery = member_cemetery(person['id'])
+				record['cemeteries'][person['id']] = cemetery
+
+	return record
 # --------------------------------------------/
 
 
 # --------------------------------------------\
-#  Read the master file index.
-#  Last update: 2024/06/10 @ 09:00am.
+#  Set up a dig_graves.py worker process.
+#  Last update: 2026/10/18 @ 03:00pm.
+#
+#  Pool initializer. Each worker reads the master index and opens its own
+#  fact cache connection, then runs dig_record() on burial files.
+#  options = toolbox.options of the main process (instruction file options).
 # --------------------------------------------\
-def read_master_index() :
+def start_dig_worker(stash, options = {}) :
 
 	# --- Vars. ---
-	global master_file_index
+	global path_to_stash
+	path_to_stash = stash
+	toolbox.options.update(options)  # Instruction file options, e.g. parser.
 
 	# --- Read master file index. ---
-	if os.path.exists(path_to_stash + master_index) :  # Does index file exist?
-		f = open(path_to_stash + master_index, 'r')
-		master_file_index = f.readlines()
-		f.close
-	else : 
-		toolbox.print_l('Error: master index file does not exist.')
-		quit()
+	read_master_index()
 # --------------------------------------------/
 
 
 # --------------------------------------------\
 #  Build a burial row for the output spreadsheet.
-#  Last update: 2024/06/06 @ 05:30pm.
+#  Last update: 2026/10/18 @ 01:30pm.
 # --------------------------------------------\
 def dig(args) :
 
@@ -497,229 +1855,95 @@ def dig(args) :
 		for index in range(len(row_data)) :
 			cols_to_write.append(row_data[index][1])
 	else:
-		# Make burial soup.
-		f = open(burial_file_name, 'r')
-		soup = BeautifulSoup(f.read(), 'html.parser')
-		f.close
-		# Loop columns. Position [index][0] is switch match for dig_this()).
-		for index in range(len(row_data)) :
-			args = [soup, row_data[index][0], formats]
-			element = dig_this(args)
-			cols_to_write.append(element)
+		record = dig_record(burial_file_name)
+		cols_to_write = dig_row(record, formats)
+
+	return cols_to_write
+# --------------------------------------------/
+
+
+# --------------------------------------------\
+#  Build burial row cells from a memorial record.
+#  Last update: 2026/10/18 @ 01:30pm.
+# --------------------------------------------\
+def dig_row(record, formats) :
+
+	# --- Vars. ---
+	cols_to_write = []
+
+	# --- Loop columns. Position [index][0] is switch match for dig_this(). ---
+	for index in range(len(row_data)) :
+		args = [record, row_data[index][0], formats]
+		cols_to_write.append(dig_this(args))
 
 	return cols_to_write
 # --------------------------------------------/
 
 
 # --------------------------------------------\
-#  Use Beautiful Soup library to find a data element.
-#  Last update: 2024/06/06 @ 10:00am.
+#  Return the cell for a data element of a memorial record.
+#  Last update: 2026/10/18 @ 01:30pm.
 # --------------------------------------------\
 def dig_this(args) :
 
 	# --- Vars. ---
-	soup = args[0]
+	record = args[0]
 	element = args[1]
 	formats = args[2]
 	cell_value = ''
-	element_value = ''
-	global lat_long
-	global g_map
-
-	# --- Check input. ---
-	if 'soup' not in locals():
-		toolbox.print_l('Error: no Soup.')
-		return False
 
 	# --- Find data value. ---
 	match element:
 		case 'cemetery':
-			cemetery_url = soup_find(soup, 'cemetery')
-			cemetery_id = cemetery_url.split('/')[2]
-			full_url = find_a_grave + cemetery_url
-			element_value = build_link(full_url, cemetery_id)
-			cell_value = element_value
-		case 'surname':
-			mem_url = soup_find(soup, 'mem_url')
-			parts = mem_url.split('/')
-			this_name_string = parts[len(parts)-1]
-			parts = re.split('-|_', this_name_string)  # Delimiter could be '-' or '_'.
-			element_value = unquote(parts[len(parts)-1].capitalize())
-			cell_value = element_value
+			if '' != record['cemetery'] :
+				cemetery_id = record['cemetery'].split('/')[2]
+				full_url = find_a_grave + record['cemetery']
+				cell_value = build_link(full_url, cemetery_id)
 		case 'name':
-			real_name = soup_find(soup, 'full_name')
+			real_name = record['name']
 			last_name = bold_last_name(real_name, formats)
 			last_name.append(real_name)
-			element_value = ['rich_name']
-			element_value.append(last_name)
-			cell_value = element_value
+			cell_value = ['rich_name', last_name]
 		case 'id':
-			memorial_id = soup_find(soup, 'mem_id')
-			full_url = find_a_grave + '/memorial/' + memorial_id
-			element_value = build_link(full_url, memorial_id)
-			cell_value = element_value
-		case 'birth':
-			element_value = soup_find(soup, 'birth')
-			cell_value = element_value
-		case 'birth_location':
-			element_value = soup_find(soup, 'birth_location')
-			cell_value = element_value
-		case 'death':
-			element_value = soup_find(soup, 'death')
-			# Remove (aged 9 months), ...
-			element_value = re.sub('[ ][(].*?[)].*', '', element_value)
-			cell_value = element_value
-		case 'death_location':
-			element_value = soup_find(soup, 'death_location')
-			cell_value = element_value
-		case 'parents_surname':
-			mem_url = soup_find(soup, 'mem_url')
-			element_value = parent_surname(soup, mem_url, formats)
-			cell_value = element_value
-		case 'parents':
-			element_value = get_by_group(soup, 'parents', formats)
-			cell_value = element_value
-		case 'father':
-			element_value = get_by_group(soup, 'father', formats)
-			cell_value = element_value
-		case 'mother':
-			element_value = get_by_group(soup, 'mother', formats)
-			cell_value = element_value
-		case 'spouses':
-			element_value = get_by_group(soup, 'spouses', formats)
-			cell_value = element_value
-		case 'children':
-			element_value = get_by_group(soup, 'children', formats)
-			cell_value = element_value
-		case 'siblings':
-			element_value = get_by_group(soup, 'siblings', formats)
-			cell_value = element_value
+			full_url = find_a_grave + '/memorial/' + record['id']
+			cell_value = build_link(full_url, record['id'])
+		case 'parents' | 'father' | 'mother' | 'spouses' | 'children' | \
+			'siblings':
+			cell_value = get_by_group(record, element, formats)
 		case 'half_siblings':
-			element_value = get_by_group(soup, 'half-siblings', formats)
-			cell_value = element_value
-		case 'veteran':
-			element_value = soup_find(soup, 'veteran')
-			cell_value = element_value
-		case 'cenotaph':
-			element_value = soup_find(soup, 'cenotaph')
-			cell_value = element_value
-		case 'plot':
-			element_value = soup_find(soup, 'plot')
-			cell_value = element_value
-		case 'bio':
-			element_value = soup_find(soup, 'bio')
-			cell_value = element_value
+			cell_value = get_by_group(record, 'half-siblings', formats)
 		case 'google_map':
-			g_map = soup_find(soup, 'google_map')
-			element_value = build_link(g_map, 'map')
-			cell_value = element_value
-		case 'latitude':
-			element_value = lat_long('lat', g_map)
-			cell_value = element_value
-		case 'longitude':
-			element_value = lat_long('long', g_map)
-			cell_value = element_value
-		case 'inscription':
-			element_value = soup_find(soup, 'inscription')
-			cell_value = element_value
-		case 'gravesite_details':
-			element_value = soup_find(soup, 'gravesite-details')
-			cell_value = element_value
+			cell_value = build_link(record['google_map'], 'map')
 		case '' :
 			toolbox.print_l('Error: no group.')
 			cell_value = ''
+		case _ :  # Plain text values.
+			cell_value = record[element]
 	return cell_value
 # --------------------------------------------/
 
 
 # --------------------------------------------\
-#  Create ouput for family groups. 
-#  Last update: 2024/06/10 @ 08:15pm.
+#  Create ouput for family groups.
+#  Last update: 2026/10/18 @ 01:30pm.
 # --------------------------------------------\
-def get_by_group(soup, group, formats, value='') :
+def get_by_group(record, group, formats) :
 
-	# --- Find soup objects by this group. ---
-	match group :
-		case 'parents' :
-			people = soup_find(soup, 'parents')
-		case 'num_parents' :
-			people = soup_find(soup, 'parents')
-		case 'father' :	
-			people = soup_find(soup, 'parents')
-		case 'mother' :
-			people = soup_find(soup, 'parents')
-		case 'spouses' :
-			people = soup_find(soup, 'spouses')
-		case 'children' :
-			people = soup_find(soup, 'children')		
-		case 'siblings' :
-			people = soup_find(soup, 'siblings')
-		case 'half-siblings' :
-			people = soup_find(soup, 'half-siblings')
+	# --- Family members for this group. ---
+	if 'father' == group or 'mother' == group :
+		people = record['family']['parents']
+	else :
+		people = record['family'][group]
 	if 0 == len(people) : return ''
 
-	# --- # of parents are used to determine surname.
-	if 'num_parents' == group :
-		return (len(people))
-
-	# --- Loop family group members for name & URL. ---
-	members = []
-	for person in people :
-		member = []
-		name = soup_find('', 'person_name', '', person)
-		url = soup_find(soup, 'person_url', '', person)
-		if '' != url : url = find_a_grave + url
-		member.append(url)
-		member.append(name)
-		members.append(member)
-	
-	# --- Formatted text output. ---
-	output = []
-	i = 0
-	for person in people :
-		name = soup_find('', 'person_name', '', person)
-		birth = soup_find(soup, 'person_birth', '', person)
-		if '' == birth : birth = 'unknown'
-		death = soup_find(soup, 'person_death', '', person)
-		if '' == death : death = 'unknown'
-		# Get memorial ID.
-		id = members[i][0].split('/')[4]  
-		# Search master file index for ID match.
-		target = '/' + id
-		# files = [x for x in master_file_index if target in x]
-		for file in master_file_index :
-			posn = file.find(target)
-			if -1 != posn :
-				break
-		if -1 == posn :
-			toolbox.print_l('Error: Missing memorial ' + id + 
-				' in master file index.' )
-			cemetery = '** missing **'
-		else :
-			cemetery = '#unknown'
-			# Make burial soup.
-			file_name = file.split('\n')[0]
-			f = open(file_name, 'r', encoding = 'utf8')
-			this_person_soup  = BeautifulSoup(f, 'html.parser')
-			f.close
-			# Get cemetery ID for this person.
-			cemetery_string = soup_find(this_person_soup, 'cemetery')
-			if '' != cemetery_string :
-				cemetery_string = cemetery_string.split('/cemetery/')[1]
-				cemetery = '#' + cemetery_string.replace('/', '_')
-
-		# Format name.
-		output += bold_last_name(name, formats)
-		#  Will always have a name, may/not have birth & death.
-		etc = ', ' + birth + ' - ' + death + ', ' + cemetery + '\n'
-		output.append(etc)
-		i += 1
-	
 	# --- Link output. ---
 	if 'father' == group or 'mother' == group :
+		members = []
+		for person in people :
+			url = person['url']
+			if '' != url : url = find_a_grave + url
+			members.append([url, person['name']])
 		match len(members) :
-			case 0 :  # if no parents, return ''
-				return ''
 			case 1 :  # If one parent, use same url for both father and mother.
 				return build_link(members[0][0], members[0][1])
 			case 2 :  # If two parents, order is always father, mother.
@@ -729,10 +1953,27 @@ def get_by_group(soup, group, formats, value='') :
 					return build_link(members[1][0], members[1][1])
 			case _ : return 'More than two parents.'
 
+	# --- Formatted text output. ---
+	output = []
+	cemeteries = record.get('cemeteries', {})
+	for person in people :
+		birth = person['birth']
+		if '' == birth : birth = 'unknown'
+		death = person['death']
+		if '' == death : death = 'unknown'
+		if person['id'] in cemeteries :
+			cemetery = cemeteries[person['id']]
+		else :
+			cemetery = member_cemetery(person['id'])
+		# Format name.
+		output += bold_last_name(person['name'], formats)
+		#  Will always have a name, may/not have birth & death.
+		etc = ', ' + birth + ' - ' + death + ', ' + cemetery + '\n'
+		output.append(etc)
+
 	# --- Rich name output. ---
 	output[len(output)-1] = output[len(output)-1].rstrip('\n')  # Remove last '\n.
 	return ['rich_name', output]  # Identify for rich string write.
-			
 # --------------------------------------------/
 
 
@@ -782,9 +2023,12 @@ def lat_long(which, gmap_url='') :
 
 # --------------------------------------------\
 #  Final worksheet tweaks
-#  Last update: 2024/06/03 @ 08:45am.
+#  Last update: 2026/10/18 @ 11:45pm.
+#
+#  widths = { column : pixels } from fit_columns(), for a constant_memory
+#  workbook (autofit() needs every cell in memory).
 # --------------------------------------------\
-def adjust_worksheet(worksheet) :
+def adjust_worksheet(worksheet, widths = None) :
 	
 	# --- Find column position. ---
 	for i in range(len(row_data)) :
@@ -809,7 +2053,12 @@ def adjust_worksheet(worksheet) :
 			break
 	
 	# --- Make worksheet adjustments. ---
-	worksheet.autofit()
+	if None == widths :
+		worksheet.autofit()
+	else :  # Streaming, see fit_columns().
+		for col, pixels in widths.items() :
+			width = min((pixels + 7 - 5) / 7, 255)  # Pixels to characters.
+			worksheet.set_column(col, col, width)
 	worksheet.freeze_panes(1, 0)
 	worksheet.set_column(birth, birth, 35)
 	worksheet.set_column(death, death, 35)
@@ -819,9 +2068,363 @@ def adjust_worksheet(worksheet) :
 # --------------------------------------------/
 
 
+# --------------------------------------------\
+#  Widen column widths (pixels) to fit a row of cells.
+#  Last update: 2026/10/18 @ 11:45pm.
+#
+#  Same measure as worksheet.autofit(), longest line of text, link text or
+#  rich string text. Only keeps the widths, not the rows.
+# --------------------------------------------\
+def fit_columns(widths, cols_to_write) :
+
+	# --- Loop columns. ---
+	for col in range(len(cols_to_write)) :
+		cell = cols_to_write[col]
+		text = ''
+		if str == type(cell) : text = cell
+		elif list == type(cell) and 'url' == cell[0] : text = cell[2]
+		elif list == type(cell) and 'rich_name' == cell[0] :
+			text = ''.join([part for part in cell[1] if str == type(part)])
+		pixels = 0
+		for line in text.split('\n') :
+			pixels = max(pixels, xl_pixel_width(line))
+		if pixels > widths.get(col, 0) : widths[col] = pixels
+	return widths
+# --------------------------------------------/
+
+
+# --------------------------------------------\
+#  Return the Parquet/Arrow schema for exported rows.
+#  Last update: 2026/10/18 @ 11:55pm.
+#
+#  One column per row_data name. Family groups are lists of members,
+#  father & mother are a member, latitude & longitude are floats.
+# --------------------------------------------\
+def export_schema() :
+
+	# --- Vars. ---
+	member = pyarrow.struct([('id', pyarrow.string()),
+		('name', pyarrow.string()), ('url', pyarrow.string()),
+		('birth', pyarrow.string()), ('death', pyarrow.string()),
+		('cemetery', pyarrow.string())])
+	fields = []
+
+	# --- Loop columns. ---
+	for index in range(len(row_data)) :
+		match row_data[index][0] :
+			case 'parents' | 'spouses' | 'children' | 'siblings' | \
+				'half_siblings' :
+				fields.append((row_data[index][0], pyarrow.list_(member)))
+			case 'father' | 'mother' :
+				fields.append((row_data[index][0], member))
+			case 'latitude' | 'longitude' :
+				fields.append((row_data[index][0], pyarrow.float64()))
+			case _ :
+				fields.append((row_data[index][0], pyarrow.string()))
+	return pyarrow.schema(fields)
+# --------------------------------------------/
+
+
+# --------------------------------------------\
+#  Return an export row (dictionary) for a memorial record.
+#  Last update: 2026/10/18 @ 11:55pm.
+#
+#  Plain values, same columns as the spreadsheet, see export_schema().
+# --------------------------------------------\
+def export_row(record) :
+
+	# --- Vars. ---
+	row = {}
+	cemeteries = record.get('cemeteries', {})
+
+	# --- Loop columns. ---
+	for index in range(len(row_data)) :
+		element = row_data[index][0]
+		match element :
+			case 'cemetery' :
+				row[element] = ''
+				if '' != record['cemetery'] :
+					row[element] = record['cemetery'].split('/')[2]
+			case 'parents' | 'spouses' | 'children' | 'siblings' :
+				row[element] = [export_member(person, cemeteries) for person
+					in record['family'][element]]
+			case 'half_siblings' :
+				row[element] = [export_member(person, cemeteries) for person
+					in record['family']['half-siblings']]
+			case 'father' | 'mother' :  # Same rules as get_by_group().
+				people = record['family']['parents']
+				row[element] = None
+				if 1 == len(people) :
+					row[element] = export_member(people[0], cemeteries)
+				if 2 == len(people) :
+					if 'father' == element : person = people[0]
+					else : person = people[1]
+					row[element] = export_member(person, cemeteries)
+			case 'latitude' | 'longitude' :
+				row[element] = None
+				if '' != record[element] : row[element] = float(record[element])
+			case _ :
+				row[element] = record[element]
+	return row
+# --------------------------------------------/
+
+
+# --------------------------------------------\
+#  Return an export member (dictionary) for a family member.
+#  Last update: 2026/10/18 @ 11:55pm.
+# --------------------------------------------\
+def export_member(person, cemeteries) :
+
+	# --- Vars. ---
+	member = dict(person)
+
+	# --- Full url & cemetery ("#id_slug"). ---
+	if '' != member['url'] : member['url'] = find_a_grave + member['url']
+	member['cemetery'] = cemeteries.get(person['id'], '')
+	return member
+# --------------------------------------------/
+
+
+# --------------------------------------------\
+#  Open a Parquet or Arrow IPC export file, return its writer.
+#  Last update: 2026/10/18 @ 11:55pm.
+#
+#  kind = 'parquet' or 'arrow'. Needs pyarrow.
+# --------------------------------------------\
+def open_export(file_name, kind) :
+
+	# --- Check input. ---
+	if None == pyarrow :
+		toolbox.print_l('Error: export "' + kind + '" needs pyarrow.')
+		quit()
+
+	# --- Open. ---
+	match kind :
+		case 'parquet' :
+			return pyarrow.parquet.ParquetWriter(file_name, export_schema())
+		case 'arrow' :
+			return pyarrow.ipc.new_file(file_name, export_schema())
+		case _ :
+			toolbox.print_l('Error: unknown export "' + kind + '".')
+			quit()
+# --------------------------------------------/
+
+
+# --------------------------------------------\
+#  Write a batch of export rows (e.g. one cemetery).
+#  Last update: 2026/10/18 @ 11:55pm.
+# --------------------------------------------\
+def write_export(writer, rows) :
+
+	# --- Check input. ---
+	if 0 == len(rows) : return
+
+	# --- Write. ---
+	table = pyarrow.Table.from_pylist(rows, schema=export_schema())
+	writer.write_table(table)
+# --------------------------------------------/
+
+
+# --------------------------------------------\
+#  Open the memorial database.
+#  Last update: 2026/10/18 @ 11:58pm.
+#
+#  SQLite database next to burials.xlsx, the extracted data set.
+#  memorials = one row per memorial, record values (memorial_columns) plus
+#   cemetery_id, birth_year, death_year, lat & lng for queries.
+#  family = one row per family member (id, grp, position), member_id is
+#   the family member's memorial ID & member_cemetery their "#id_slug".
+#  cemeteries = cemetery ID, url & instruction file abbreviation.
+#  burials = worksheet rows, burial memorial IDs in order for a cemetery.
+#  e.g. SELECT name, death FROM memorials WHERE surname = 'Doe'
+# --------------------------------------------\
+def open_memorial_db() :
+
+	# --- Vars. ---
+	global memorial_db
+
+	# --- Open (or create) database. ---
+	if None != memorial_db :
+		return memorial_db
+	memorial_db = sqlite3.connect(path_to_output + memorial_db_name,
+		timeout=30, isolation_level=None)  # Autocommit.
+	memorial_db.execute('PRAGMA journal_mode=WAL')
+	memorial_db.execute('PRAGMA synchronous=NORMAL')
+	version = memorial_db.execute('PRAGMA user_version').fetchone()[0]
+	if memorial_db_version != version :  # Old tables, start over.
+		for table in ['memorials', 'family', 'cemeteries', 'burials'] :
+			memorial_db.execute('DROP TABLE IF EXISTS ' + table)
+		memorial_db.execute('PRAGMA user_version=' + str(memorial_db_version))
+	memorial_db.execute('CREATE TABLE IF NOT EXISTS memorials (' +
+		' TEXT, '.join(memorial_columns) + ' TEXT, cemetery_id TEXT, '
+		'birth_year INTEGER, death_year INTEGER, lat REAL, lng REAL, '
+		'PRIMARY KEY (id))')
+	memorial_db.execute('CREATE TABLE IF NOT EXISTS family (id TEXT, '
+		'grp TEXT, position INTEGER, member_id TEXT, name TEXT, url TEXT, '
+		'birth TEXT, death TEXT, member_cemetery TEXT, '
+		'PRIMARY KEY (id, grp, position))')
+	memorial_db.execute('CREATE TABLE IF NOT EXISTS cemeteries (id TEXT '
+		'PRIMARY KEY, url TEXT, abbreviation TEXT)')
+	memorial_db.execute('CREATE TABLE IF NOT EXISTS burials (cemetery TEXT, '
+		'position INTEGER, id TEXT, PRIMARY KEY (cemetery, position))')
+	for column in ['surname', 'cemetery_id', 'birth_year', 'death_year'] :
+		memorial_db.execute('CREATE INDEX IF NOT EXISTS memorials_' + column +
+			' ON memorials (' + column + ')')
+	memorial_db.execute('CREATE INDEX IF NOT EXISTS family_member_id '
+		'ON family (member_id)')
+	return memorial_db
+# --------------------------------------------/
+
+
+# --------------------------------------------\
+#  Close the memorial database.
+#  Last update: 2026/10/18 @ 11:58pm.
+# --------------------------------------------\
+def close_memorial_db() :
+
+	# --- Vars. ---
+	global memorial_db
+
+	# --- Close database. ---
+	if None != memorial_db :
+		memorial_db.close()
+		memorial_db = None
+# --------------------------------------------/
+
+
+# --------------------------------------------\
+#  Save a memorial record (from dig_record()) to the memorial database.
+#  Last update: 2026/10/18 @ 11:58pm.
+# --------------------------------------------\
+def store_memorial(record) :
+
+	# --- Vars. ---
+	db = open_memorial_db()
+	values = [record[column] for column in memorial_columns]
+	cemetery_id = ''
+	if '' != record['cemetery'] : cemetery_id = record['cemetery'].split('/')[2]
+	lat = None
+	if '' != record['latitude'] : lat = float(record['latitude'])
+	lng = None
+	if '' != record['longitude'] : lng = float(record['longitude'])
+	values += [cemetery_id, date_year(record['birth']),
+		date_year(record['death']), lat, lng]
+	cemeteries = record.get('cemeteries', {})
+
+	# --- Memorial, family & cemetery, all or nothing. ---
+	db.execute('BEGIN')
+	db.execute('INSERT OR REPLACE INTO memorials VALUES (' +
+		', '.join(['?'] * len(values)) + ')', values)
+	db.execute('DELETE FROM family WHERE id = ?', (record['id'],))
+	for group in record['family'] :
+		for position in range(len(record['family'][group])) :
+			person = record['family'][group][position]
+			db.execute('INSERT INTO family VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)',
+				(record['id'], group, position, person['id'], person['name'],
+				person['url'], person['birth'], person['death'],
+				cemeteries.get(person['id'])))
+	if '' != cemetery_id :
+		db.execute('INSERT OR IGNORE INTO cemeteries (id, url) VALUES (?, ?)',
+			(cemetery_id, record['cemetery']))
+	db.execute('COMMIT')
+# --------------------------------------------/
+
+
+# --------------------------------------------\
+#  Save the burial memorial IDs (worksheet rows) of a cemetery.
+#  Last update: 2026/10/18 @ 11:58pm.
+# --------------------------------------------\
+def store_burials(cemetery_id, abbreviation, mem_ids) :
+
+	# --- Vars. ---
+	db = open_memorial_db()
+
+	# --- Replace the cemetery's burials. ---
+	db.execute('BEGIN')
+	db.execute('DELETE FROM burials WHERE cemetery = ?', (cemetery_id,))
+	db.executemany('INSERT INTO burials VALUES (?, ?, ?)',
+		[(cemetery_id, position, mem_ids[position]) for position in
+		range(len(mem_ids))])
+	db.execute('INSERT OR IGNORE INTO cemeteries (id) VALUES (?)',
+		(cemetery_id,))
+	db.execute('UPDATE cemeteries SET abbreviation = ? WHERE id = ?',
+		(abbreviation, cemetery_id))
+	db.execute('COMMIT')
+# --------------------------------------------/
+
+
+# --------------------------------------------\
+#  Return a memorial record from the memorial database.
+#  Last update: 2026/10/18 @ 11:58pm.
+#
+#  Same record as dig_record(), so dig_row() works the same on either.
+#  None if the memorial isn't in the database.
+# --------------------------------------------\
+def load_record(mem_id) :
+
+	# --- Vars. ---
+	db = open_memorial_db()
+	record = {}
+
+	# --- Memorial. ---
+	row = db.execute('SELECT ' + ', '.join(memorial_columns) +
+		' FROM memorials WHERE id = ?', (mem_id,)).fetchone()
+	if None == row :
+		return None
+	for index in range(len(memorial_columns)) :
+		record[memorial_columns[index]] = row[index]
+
+	# --- Family & their cemeteries. ---
+	record['family'] = {}
+	for group in family_labels.values() :
+		record['family'][group] = []
+	record['cemeteries'] = {}
+	rows = db.execute('SELECT grp, member_id, name, url, birth, death, '
+		'member_cemetery FROM family WHERE id = ? ORDER BY grp, position',
+		(mem_id,))
+	for row in rows :
+		person = {'name' : row[2], 'url' : row[3], 'id' : row[1],
+			'birth' : row[4], 'death' : row[5]}
+		record['family'].setdefault(row[0], []).append(person)
+		if None != row[6] : record['cemeteries'][row[1]] = row[6]
+	return record
+# --------------------------------------------/
+
+
+# --------------------------------------------\
+#  Return the burial memorial IDs (worksheet rows) of a cemetery.
+#  Last update: 2026/10/18 @ 11:58pm.
+# --------------------------------------------\
+def load_burials(cemetery_id) :
+
+	# --- Vars. ---
+	db = open_memorial_db()
+
+	# --- In worksheet order. ---
+	rows = db.execute('SELECT id FROM burials WHERE cemetery = ? '
+		'ORDER BY position', (cemetery_id,))
+	return [row[0] for row in rows]
+# --------------------------------------------/
+
+
+# --------------------------------------------\
+#  Return the year of a memorial date (e.g. '1 Jan 1900'), None if none.
+#  Last update: 2026/10/18 @ 11:58pm.
+# --------------------------------------------\
+def date_year(date) :
+
+	# --- Last 4 digit number. ---
+	years = re.findall(r'\b\d{4}\b', date)
+	if 0 == len(years) : return None
+	return int(years[-1])
+# --------------------------------------------/
+
+
 # --------------------------------------------\
 #  Use Beautiful Soup library to find data element(s).
-#  Last update: 2024/06/10 @ 03:00pm.
+#  Last update: 2026/10/18 @ 10:00pm.
+#
+#  No CSS select(), it's slow & not every parser builds the same tree for it.
 # --------------------------------------------\
 def soup_find(soup, what, type='', value='') :
 
@@ -870,8 +2473,7 @@ def soup_find(soup, what, type='', value='') :
 			if None == item : return ''
 			else : return toolbox.clean_string(item.text)
 		case 'parents' :
-			label = '[aria-labelledby="parentsLabel"] li [itemprop="name"]'
-			cup_of_soup = soup.select(label)
+			cup_of_soup = family_names(soup, 'parentsLabel')
 			if None == cup_of_soup : return ''
 			return cup_of_soup
 		case 'person_name' :
@@ -890,28 +2492,27 @@ def soup_find(soup, what, type='', value='') :
 			if None == item : return ''
 			else : return toolbox.clean_string(item.text)
 		case 'spouses' :
-			label = '[aria-labelledby="spouseLabel"] li [itemprop="name"]'
-			cup_of_soup = soup.select(label)
+			cup_of_soup = family_names(soup, 'spouseLabel')
 			if None == cup_of_soup : return ''
 			return cup_of_soup
 		case 'children' :
-			label = '[aria-labelledby="childrenLabel"] li [itemprop="name"]'
-			cup_of_soup = soup.select(label)
+			cup_of_soup = family_names(soup, 'childrenLabel')
 			if None == cup_of_soup : return ''
 			return cup_of_soup
 		case 'siblings' :
-			label = '[aria-labelledby="siblingLabel"] li [itemprop="name"]'
-			cup_of_soup = soup.select(label)
+			cup_of_soup = family_names(soup, 'siblingLabel')
 			if None == cup_of_soup : return ''
 			return cup_of_soup
 		case 'half-siblings' :
-			label = '[aria-labelledby="halfSibLabel"] li [itemprop="name"]'
-			cup_of_soup = soup.select(label)
+			cup_of_soup = family_names(soup, 'halfSibLabel')
 			if None == cup_of_soup : return ''
 			return cup_of_soup	
 		case 'veteran' :
-			item = soup.select('h1 .icon-vet')
-			if 0 == len(item) : return ''
+			item = None
+			for heading in soup.find_all('h1') :
+				item = heading.find(class_='icon-vet')
+				if None != item : break
+			if None == item : return ''
 			else : return 'Y'
 		case 'cenotaph' :
 			item = soup.find(id='cemeteryLabel')
@@ -954,31 +2555,189 @@ def soup_find(soup, what, type='', value='') :
 # --------------------------------------------/
 
 
+# --------------------------------------------\
+#  Make soup from page markup.
+#  Last update: 2026/10/18 @ 11:59pm.
+#
+#  "parser : html.parser" (default) or "parser : lxml" picks one,
+#  "parser : auto" uses lxml if installed, else html.parser.
+#  partial = only build the parts of a memorial page extract_memorial() &
+#  page_family_urls() use, see keep_tag(). Memorial pages only: search &
+#  cemetery pages would lose their lists. get_facts() passes the
+#  "partial_parse" option.
+# --------------------------------------------\
+def make_soup(markup, parser = '', partial = False) :
+
+	# --- Vars. ---
+	if '' == parser : parser = parser_name()
+
+	# --- Parse. ---
+	if partial :
+		return BeautifulSoup(markup, parser, parse_only=MemorialStrainer())
+	return BeautifulSoup(markup, parser)
+# --------------------------------------------/
+
+
+# --------------------------------------------\
+#  Return the BeautifulSoup parser name for this run.
+#  Last update: 2026/10/18 @ 11:59pm.
+#
+#  html.parser unless the "parser" option says otherwise, so output only
+#  changes when asked.
+# --------------------------------------------\
+def parser_name() :
+
+	# --- Vars. ---
+	global html_parser
+
+	# --- Pick once. ---
+	if None == html_parser :
+		html_parser = toolbox.get_option('parser', 'html.parser')
+		if 'auto' == html_parser :
+			html_parser = 'html.parser'
+			if None != lxml : html_parser = 'lxml'
+		if 'lxml' == html_parser and None == lxml :
+			toolbox.print_l('Error: parser "lxml" is not installed.')
+			quit()
+		if html_parser not in ['lxml', 'html.parser'] :
+			toolbox.print_l('Error: unknown parser "' + html_parser + '".')
+			quit()
+	return html_parser
+# --------------------------------------------/
+
+
+# --------------------------------------------\
+#  SoupStrainer that keeps the memorial page parts we use.
+#  Last update: 2026/10/18 @ 11:00pm.
+#
+#  Beautiful Soup asks a strainer about each top level tag while parsing,
+#  a kept tag keeps everything inside it. Older bs4 calls search_tag(),
+#  4.13 & later call allow_tag_creation(). Both go to keep_tag().
+# --------------------------------------------\
+class MemorialStrainer(SoupStrainer) :
+
+	def search_tag(self, name, attrs = {}) :
+		return keep_tag(name, attrs)
+
+	def allow_tag_creation(self, nsprefix, name, attrs) :
+		return keep_tag(name, attrs)
+
+	def allow_string_creation(self, string) :
+		return False  # No loose text between kept tags.
+# --------------------------------------------/
+
+
+# --------------------------------------------\
+#  Should a partial parse keep this tag (and everything in it)?
+#  Last update: 2026/10/18 @ 11:00pm.
+#
+#  Keeps the canonical link, h1 (name & veteran icon), the cemetery link
+#  (cemeteryNameLabel's parent), memorial_ids elements & family lists.
+# --------------------------------------------\
+def keep_tag(name, attrs) :
+
+	# --- Vars. ---
+	if None == attrs : attrs = {}
+	if not isinstance(attrs, dict) : attrs = dict(attrs)
+
+	# --- Keep? ---
+	if 'h1' == name : return True
+	if 'link' == name and 'canonical' in attrs.get('rel', '') : return True
+	if 'a' == name and '/cemetery/' in attrs.get('href', '') : return True
+	if attrs.get('id') in memorial_ids : return True
+	if attrs.get('aria-labelledby') in family_labels : return True
+	return False
+# --------------------------------------------/
+
+
+# --------------------------------------------\
+#  Return the family member name elements for a family list label.
+#  Last update: 2026/10/18 @ 10:00pm.
+#
+#  Same as select('[aria-labelledby="label"] li [itemprop="name"]').
+# --------------------------------------------\
+def family_names(soup, label) :
+
+	# --- Vars. ---
+	names = []
+
+	# --- Loop family lists. ---
+	for family_list in soup.find_all(attrs={'aria-labelledby' : label}) :
+		for person in list_names(family_list) :
+			# Same element, not an equal looking one.
+			if not any(person is name for name in names) : names.append(person)
+	return names
+# --------------------------------------------/
+
+
+# --------------------------------------------\
+#  Return the name elements in one family list element.
+#  Last update: 2026/10/18 @ 10:00pm.
+#
+#  Names must be inside a list item (li) of the family list.
+# --------------------------------------------\
+def list_names(family_list) :
+
+	# --- Vars. ---
+	names = []
+
+	# --- Loop names, keep those in a list item. ---
+	for person in family_list.find_all(attrs={'itemprop' : 'name'}) :
+		for parent in person.parents :
+			if parent is family_list : break
+			if 'li' == parent.name :
+				names.append(person)
+				break
+	return names
+# --------------------------------------------/
+
+
+# --------------------------------------------\
+#  Compare memorial facts from a parser with a full html.parser parse.
+#  Last update: 2026/10/18 @ 11:00pm.
+#
+#  partial = the parser does a partial parse, see make_soup().
+#  Return a list of record keys with different values ([] = same).
+# --------------------------------------------\
+def check_parser(file_name, parser, partial = False) :
+
+	# --- Extract both ways. ---
+	markup = read_page(file_name)
+	expected = extract_memorial(make_soup(markup, 'html.parser', False))
+	actual = extract_memorial(make_soup(markup, parser, partial))
+
+	# --- Compare. ---
+	keys = []
+	for key in expected :
+		if expected[key] != actual.get(key) : keys.append(key)
+	return keys
+# --------------------------------------------/
+
+
 # --------------------------------------------\
 #  Parent surname.
-#  Last update: 2024/06/04 @ 12:15pm.
+#  Last update: 2026/10/18 @ 01:30pm.
 # --------------------------------------------\
-def parent_surname(soup, mem_url, formats) :
+def parent_surname(record) :
 
 	# --- Last name for this person. ---
-	parts = mem_url.split('/')
+	parts = record['url'].split('/')
 	this_name_string = parts[len(parts)-1]
 	parts = re.split('-|_', this_name_string)  # Delimiter could be '-' or '_'.
 	this_last_name = parts[len(parts)-1]  # Lower case.
 
 	# --- Last name for this father. ---
-	father = get_by_group(soup, 'father', formats)
-	if '' == father : father_last_name = ''
+	parents = record['family']['parents']
+	if 0 == len(parents) : father_last_name = ''
 	else :
-		father_url = father[1]
+		father_url = parents[0]['url']
 		parts = father_url.split('/')
 		father_name_string = parts[len(parts)-1]
 		parts = re.split('-|_', father_name_string)  # Delimiter could be '-' or '_'.
 		father_last_name = parts[len(parts)-1]  # Lower case.
 
 	# --- Choose surname based on number of parents. ---
-	num_parents = get_by_group(soup, 'num_parents', formats)
-	match num_parents :
+	match len(parents) :
 		case 0: return ''
 		case 1:
 			if this_last_name == father_last_name :
@@ -20,9 +20,8 @@
 # Standard Libraries
 import time  #https://docs.python.org/3/library/time.html
 import re
+import os  # https://docs.python.org/3/library/os.html
 # Packages
-import requests  # https://pypi.org/project/requests/
-from bs4 import BeautifulSoup  # https://www.crummy.com/software/BeautifulSoup/bs4/doc/
 # My modules
 import toolbox  # https://github.com/doug-foster/find-a-grave-tools
 import grave_digger  # https://github.com/doug-foster/find-a-grave-tools
@@ -40,135 +39,300 @@ this_script = this_script[len(this_script)-1]
 
 # --------------------------------------------\
 # Search for memorials on a page.
+#
+# "--fetchers N" reads the result count from page 1 & gets the other
+# pages N at a time ("--rps R" requests per second), still in page order.
+# Without a count (or fetchers) pages are read one at a time as before.
 # --------------------------------------------\
 def get_memorials(session, searchInfo) :
     # split the searchInfo into the searchUrl and name based on ;
 	searchUrl, searchType = searchInfo.split(';')
- 
-	plotNameToRemove = 'Last Supper'
 
 	max_pages = 500
 	page = 1
 	loop = True
 	memorialInfo = []
- 
-	# Define regex pattern for a date in the format of '31 Jan 1977' or 'unknown'
-	date_pattern =  r'(?:\d{1,2} \w{3} )?(\d{4}|unknown)'
+	fetchers = int(toolbox.get_option('fetchers', 1))
+
+	# --- Page 1, then the rest concurrently if we know how many. ---
+	if fetchers > 1 :
+		url = searchUrl + '&page=1'
+		toolbox.print_l('Loading ' + url)
+		request = toolbox.get_url(session, url)
+		if False == request :  # Retries ran out.
+			toolbox.print_l('Error: ' + url + ' failed.')
+			return memorialInfo
+		soup = grave_digger.make_soup(request.content)
+		pageInfo = page_memorials(soup, searchType, 1)
+		if None == pageInfo :
+			return memorialInfo  # No matches.
+		memorialInfo += pageInfo
+		page = 2
+		total = result_count(request.text)
+		if None != total and len(pageInfo) > 0 :
+			last_page = min(-(-total // len(pageInfo)), max_pages - 1)  # Round up.
+			toolbox.print_l(searchType + ' - ' + str(total) + ' memorials, ' + 
+				str(last_page) + ' pages.')
+			urls = [searchUrl + '&page=' + str(n) for n in range(2, last_page + 1)]
+			for url, request in toolbox.get_urls(session, urls, fetchers) :
+				if False == request :  # Retries ran out, skip the page.
+					toolbox.print_l('Error: ' + url + ' failed, skipped.')
+					page += 1
+					continue
+				soup = grave_digger.make_soup(request.content)
+				pageInfo = page_memorials(soup, searchType, page)
+				if None == pageInfo :
+					loop = False  # Fewer pages than counted.
+				else :
+					memorialInfo += pageInfo
+				page += 1
+			# The next page should say "no matches", check it below.
 
 	while (loop) :
 
 		# --- Prevent runaways. ---
 		if (page == max_pages) :  # 
-			toolbox.print_l('Error: exceeded max (' + max_pages + ') pages.')
+			toolbox.print_l('Error: exceeded max (' + str(max_pages) + ') pages.')
 			quit()
 
 		# --- Get index page. ---
 		url = searchUrl + '&page=' + str(page)
 		toolbox.print_l('Loading ' + url)
 		request = toolbox.get_url(session, url)
+		if False == request :  # Retries ran out.
+			toolbox.print_l('Error: ' + url + ' failed, stopping.')
+			break
 
 		# -- Make burial soup. --
-		soup = BeautifulSoup(request.content, 'html.parser')
+		soup = grave_digger.make_soup(request.content)
 
 		# --- If last page, stop looping. ---
-		# Search page tags for warnings.
-		warnings = grave_digger.soup_find(soup, 'warnings')
-		for warning in warnings :  # Loop warnings.
-			# No more pages?
-			if warning.parent.text.lower().find('no matches found') > 0 :
-				loop = False # No more pages.
-				break
-		if not loop :
+		pageInfo = page_memorials(soup, searchType, page)
+		if None == pageInfo :
 			break
-	
-		# Search page for memorial items.
-		memorials = grave_digger.soup_find(soup, 'memorials')
+		memorialInfo += pageInfo
+
+		if (loop) :
+			#break
+			page += 1  # Increment page.
+			grave_digger.pause_digging(0.5,2)  # Pace requests.
+
+	# --- Photographers, all pages at once. ---
+	find_photographers(session, memorialInfo)
+
+	return memorialInfo
+
+# --------------------------------------------/
+
+
+# --------------------------------------------\
+# Return the memorials on a search results page, None if no matches.
+# --------------------------------------------\
+def page_memorials(soup, searchType, page) :
+
+	plotNameToRemove = 'Last Supper'
+	memorialInfo = []
+
+	# Define regex pattern for a date in the format of '31 Jan 1977' or 'unknown'
+	date_pattern =  r'(?:\d{1,2} \w{3} )?(\d{4}|unknown)'
+
+	# Search page tags for warnings.
+	warnings = grave_digger.soup_find(soup, 'warnings')
+	for warning in warnings :  # Loop warnings.
+		# No more pages?
+		if warning.parent.text.lower().find('no matches found') > 0 :
+			return None # No more pages.
+
+	# Search page for memorial items.
+	memorials = grave_digger.soup_find(soup, 'memorials')
 
-		toolbox.print_l(searchType + ' - page ' + str(page) + ' has ' + str(len(memorials)) + ' memorials.')
+	toolbox.print_l(searchType + ' - page ' + str(page) + ' has ' + str(len(memorials)) + ' memorials.')
 
-		# --- Loop memorials ---
-		for memorial in memorials : # Loop memorial items.
-			memorial_url = memorial.a['href']
+	# --- Loop memorials ---
+	for memorial in memorials : # Loop memorial items.
+		memorial_url = memorial.a['href']
    
-			# get the name after the last / in the url
-			memorial_name = memorial_url.split('/')[-1]
+		# get the name after the last / in the url
+		memorial_name = memorial_url.split('/')[-1]
    
-   			# get last name from memorial name a-b-c -> c  and get first names a-b-c -> a-b
-			memorial_name = memorial_name.split('-')[-1] + ', ' + '-'.join(memorial_name.split('-')[:-1])
+   		# get last name from memorial name a-b-c -> c  and get first names a-b-c -> a-b
+		memorial_name = memorial_name.split('-')[-1] + ', ' + '-'.join(memorial_name.split('-')[:-1])
    
-			# capitalize each word in the name and replace _ with a space
-			memorial_name = memorial_name.replace('_', ' ').replace('-', ' ').title()
+		# capitalize each word in the name and replace _ with a space
+		memorial_name = memorial_name.replace('_', ' ').replace('-', ' ').title()
    
-			small_tag = memorial.find('small')  # Find the first <small> tag in the current 'div'
-			needsPhoto = small_tag and 'No grave photo' in small_tag.get_text(strip=True)
+		small_tag = memorial.find('small')  # Find the first <small> tag in the current 'div'
+		needsPhoto = small_tag and 'No grave photo' in small_tag.get_text(strip=True)
 
-			h2 = memorial.find('i', {'class' : 'pe-2'})
-			name = h2.get_text(strip=True) if h2 else None
+		h2 = memorial.find('i', {'class' : 'pe-2'})
+		name = h2.get_text(strip=True) if h2 else None
 
-			# get plot, and strip out "Last Supper"
-			strong = memorial.strong
-			plot = re.sub(plotNameToRemove, '', strong.get_text(strip=True), flags=re.IGNORECASE) if strong else None
+		# get plot, and strip out "Last Supper"
+		strong = memorial.strong
+		plot = re.sub(plotNameToRemove, '', strong.get_text(strip=True), flags=re.IGNORECASE) if strong else None
    
-			b = memorial.find('b', {'class' : 'birthDeathDates'})
-			dates = b.get_text(strip=True) if b else None
-
-			# dates may have:
-			#   unknown – 31 Jan 1977
-			#   31 Jan 1977 - unknown
-			#   Birth and death dates unknown.
-			#	unknown – 1993
-   			#   31 Jan 1927 - 31 Jan 1977
-			# extract the birth and death dates
-			birthAndDeath = ''
-			if dates == 'Birth and death dates unknown.':  # If both dates are unknown, assign them as such
-				birthAndDeath = 'unknown'
+		b = memorial.find('b', {'class' : 'birthDeathDates'})
+		dates = b.get_text(strip=True) if b else None
+
+		# dates may have:
+		#   unknown – 31 Jan 1977
+		#   31 Jan 1977 - unknown
+		#   Birth and death dates unknown.
+		#	unknown – 1993
+   		#   31 Jan 1927 - 31 Jan 1977
+		# extract the birth and death dates
+		birthAndDeath = ''
+		if dates == 'Birth and death dates unknown.':  # If both dates are unknown, assign them as such
+			birthAndDeath = 'unknown'
+		else:
+			matches = re.findall(date_pattern, dates.lower())
+			# Depending on the number of matches, assign them to birth and death
+			if len(matches) == 2:
+				birthAndDeath = matches[0] + '-' + matches[1]  # Two dates found: assign them
+				birthAndDeath = birthAndDeath.replace('unknown', '?')
 			else:
-				matches = re.findall(date_pattern, dates.lower())
-				# Depending on the number of matches, assign them to birth and death
-				if len(matches) == 2:
-					birthAndDeath = matches[0] + '-' + matches[1]  # Two dates found: assign them
-					birthAndDeath = birthAndDeath.replace('unknown', '?')
-				else:
-					birthAndDeath = matches[0]  # Only one date found: assign it
-
-			# if there is a photo, retrieve the page and look for "Photo added by <a href=...>NAME</a>" and get the name
-			photographer = None
-			# only do this if the searchTitle includes "HasGps"
-			if not needsPhoto and searchType.find('Has GPS') > 0:
-				photo_request = toolbox.get_url(session, 'https://www.findagrave.com' + memorial_url)
-				photo_soup = BeautifulSoup(photo_request.content, 'html.parser')
-				photo_tag = photo_soup.find('figure', {'id' : 'profile-photo'})
-				if photo_tag:
-					photographer = photo_tag.p.a.get_text(strip=True)
-
-			# if photographer is Priscilla, set instructions to "Update GPS"; if needsPhoto, say "Take Photo" otherwise say "-"
-			instructions = 'Update GPS' if photographer == 'Priscilla' else 'Take Photo' if needsPhoto else 'Add GPS' if searchType.find('No GPS') > 0 else '-'
-
-			memorialInfo.append({
-			'memorial-name': memorial_name, 
-			'dates': birthAndDeath,
+				birthAndDeath = matches[0]  # Only one date found: assign it
+
+		# if there is a photo, the photographer is looked up later, see find_photographers()
+		photographer = None
+		instructions = memorial_instructions(photographer, needsPhoto, searchType)
+
+		memorialInfo.append({
+		'memorial-name': memorial_name, 
+		'dates': birthAndDeath,
             'plot': plot,
-			'instructions': instructions,
-			'#': memorial_url.split('/')[2],
-			'searchType': searchType,
-			'full-name': name, 
-			'raw-dates': dates,
-			'noPhoto': needsPhoto,
-			'photographer': photographer,
-			'url': memorial_url, 
-			})
+		'instructions': instructions,
+		'#': memorial_url.split('/')[2],
+		'searchType': searchType,
+		'full-name': name, 
+		'raw-dates': dates,
+		'noPhoto': needsPhoto,
+		'photographer': photographer,
+		'url': memorial_url, 
+		})
    
-			toolbox.print_l('       ' + memorial_name)
-			
-
-		if (loop) :
-			#break
-			page += 1  # Increment page.
-			toolbox.pause(0.5,2,True)  # Pace requests.
+		toolbox.print_l('       ' + memorial_name)
 
 	return memorialInfo
 
-# --------------------------------------------/	
+# --------------------------------------------/
+
+
+# --------------------------------------------\
+# Return the instructions for a memorial.
+# --------------------------------------------\
+def memorial_instructions(photographer, needsPhoto, searchType) :
+
+	# if photographer is Priscilla, set instructions to "Update GPS"; if needsPhoto, say "Take Photo" otherwise say "-"
+	return 'Update GPS' if photographer == 'Priscilla' else 'Take Photo' if needsPhoto else 'Add GPS' if searchType.find('No GPS') > 0 else '-'
+
+# --------------------------------------------/
+
+
+# --------------------------------------------\
+# Fill in the photographer of photographed "Has GPS" memorials.
+#
+# Looked up in order: photographers cache (fact_cache.db, by memorial ID),
+# stashed memorial pages (master index), then the memorial pages are
+# fetched "--fetchers N" at a time. Results are cached for later runs,
+# stamped with when the page was fetched (or stashed), & used for
+# "--photo_days D" days (default 30), then looked up again.
+# --------------------------------------------\
+def find_photographers(session, memorialInfo) :
+
+	# only do this if the searchTitle includes "HasGps"
+	lookups = {}  # Memorial ID : memorials with that ID.
+	for info in memorialInfo :
+		if not info['noPhoto'] and info['searchType'].find('Has GPS') > 0:
+			lookups.setdefault(info['#'], []).append(info)
+	if 0 == len(lookups) :
+		return
+
+	# --- Cached from an earlier run, recently enough? ---
+	cache = grave_digger.open_fact_cache()
+	oldest = time.time() - float(toolbox.get_option('photo_days', 30)) * 86400
+	photographers = {}
+	found = []  # [memorial ID, photographer, page time], saved below.
+	for mem_id in lookups :
+		row = cache.execute('SELECT photographer FROM photographers WHERE id = ?'
+			' AND fetched >= ?', (mem_id, oldest)).fetchone()
+		if None != row :
+			photographers[mem_id] = row[0]
+
+	# --- Stashed page? ---
+	if 0 == len(grave_digger.master_file_index) and \
+		os.path.exists(path_to_stash + grave_digger.master_index) :
+		grave_digger.read_master_index()
+	for mem_id in lookups :
+		entry = grave_digger.master_file_index.get(mem_id)
+		if mem_id in photographers or None == entry :
+			continue
+		file_name = grave_digger.stash_file(entry['file'].rsplit('.', 1)[0])
+		if os.path.isfile(file_name) and os.path.getmtime(file_name) >= oldest :
+			markup = grave_digger.read_page(file_name)
+			photographers[mem_id] = photo_credit(markup)
+			found.append([mem_id, photographers[mem_id], 
+				os.path.getmtime(file_name)])
+
+	# --- Fetch the rest. ---
+	urls = []
+	for mem_id in lookups :
+		if mem_id not in photographers :
+			urls.append('https://www.findagrave.com' + lookups[mem_id][0]['url'])
+	toolbox.print_l('Photographers: ' + str(len(lookups) - len(urls)) + 
+		' known, fetching ' + str(len(urls)) + ' memorial pages.')
+	fetchers = int(toolbox.get_option('fetchers', 1))
+	for url, photo_request in toolbox.get_urls(session, urls, fetchers) :
+		if False == photo_request :  # Not cached, tried again next run.
+			continue
+		mem_id = url.split('/')[4]
+		photographers[mem_id] = photo_credit(photo_request.content)
+		found.append([mem_id, photographers[mem_id], time.time()])
+
+	# --- Save & fill in. ---
+	cache.execute('BEGIN')
+	cache.executemany('INSERT OR REPLACE INTO photographers VALUES (?, ?, ?)',
+		found)
+	cache.execute('COMMIT')
+	for mem_id in lookups :
+		for info in lookups[mem_id] :
+			info['photographer'] = photographers.get(mem_id)
+			info['instructions'] = memorial_instructions(info['photographer'], 
+				info['noPhoto'], info['searchType'])
+
+# --------------------------------------------/
+
+
+# --------------------------------------------\
+# Return the photographer of a memorial page's profile photo, None if none.
+# look for "Photo added by <a href=...>NAME</a>" and get the name
+# --------------------------------------------\
+def photo_credit(markup) :
+
+	photo_soup = grave_digger.make_soup(markup, '', False)  # Whole page.
+	photo_tag = photo_soup.find('figure', {'id' : 'profile-photo'})
+	if photo_tag:
+		return photo_tag.p.a.get_text(strip=True)
+	return None
+
+# --------------------------------------------/
+
+
+# --------------------------------------------\
+# Return the number of memorials a search found (page 1), None if not shown.
+# e.g. "1,234 matching records" or "Showing 1 - 20 of 1,234".
+# --------------------------------------------\
+def result_count(text) :
+
+	# --- Look for the count. ---
+	match = re.search(r'([\d,]+)\s+(?:matching\s+)?(?:records|memorials|results)'
+		r'\s+found|\bof\s+([\d,]+)\s+(?:records|memorials|results)', text, 
+		re.IGNORECASE)
+	if None == match :
+		return None
+	return int((match.group(1) or match.group(2)).replace(',', ''))
+
+# --------------------------------------------/
 
 
 
@@ -178,17 +342,23 @@ searchInfos = grave_digger.getUrls()
 # --- Start. ---
 toolbox.print_l('Started script @ ' + time.strftime('%Y%m%d-%H%M%S') + '.')
 
-# --- Establish a new "browser" session. ---
-# https://stackoverflow.com/questions/73688432/python-request-with-cookies-content-blocked-by-cookie-banner
-session = requests.Session()
-descriptor = 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML,'
-descriptor += ' like Gecko) Chrome/104.0.5112.79 Safari/537.36'
-headers = {
-	'User-Agent': descriptor
-}
-session.headers.update(headers)
-session.cookies.set("name", "notice_preferences", domain=cookie_domain)
-session.cookies.set( "value", "2:", domain=cookie_domain)
+# --- Request pacing, see get_memorials(). ---
+fetchers = int(toolbox.get_option('fetchers', 1))
+if fetchers > 1 :
+	rps = float(toolbox.get_option('rps', 1))
+	toolbox.set_rate(rps, float(toolbox.get_option('host_rps', rps)))
+pace = toolbox.get_option('pace', None)  # Replaces rps, see stash_graves.py.
+if None != pace :
+	toolbox.set_pacer(float(pace))
+
+# --- Establish a new "browser" session, a connection per fetcher. ---
+session = toolbox.new_session(cookie_domain, fetchers)
+
+# --- HTTP cache, see stash_graves.py. ---
+http_cache = toolbox.get_option('http_cache', None)
+if None != http_cache :
+	toolbox.open_http_cache(grave_digger.path_to_stash, float(http_cache), 
+		float(toolbox.get_option('http_cache_size', 500)))
 
 memorials = []
 
@@ -204,6 +374,8 @@ df = pd.DataFrame(memorials)
 stop_time = time.strftime('%Y%m%d-%H%M%S')
 
 df.to_excel('memorial_data_' + stop_time + '.xlsx', index=False)
+grave_digger.close_fact_cache()
+toolbox.close_http_cache()
 
 print("Data saved to memorial_data.xlsx")
 
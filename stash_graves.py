@@ -20,10 +20,8 @@
 # Standard Libraries
 import time  #https://docs.python.org/3/library/time.html
 import os  # https://docs.python.org/3/library/os.html
-import shutil  # https://docs.python.org/3/library/shutil.html
+import heapq  # https://docs.python.org/3/library/heapq.html
 # Packages
-import requests  # https://pypi.org/project/requests/
-from bs4 import BeautifulSoup  # https://www.crummy.com/software/BeautifulSoup/bs4/doc/
 # My modules
 import toolbox  # https://github.com/doug-foster/find-a-grave-tools
 import grave_digger  # https://github.com/doug-foster/find-a-grave-tools
@@ -32,7 +30,6 @@ import grave_digger  # https://github.com/doug-foster/find-a-grave-tools
 cookie_domain = grave_digger.cookie_domain
 path_to_stash = grave_digger.path_to_stash
 burial_urls = []
-master_list_of_urls = []
 this_script = __file__.split('\\')
 this_script = this_script[len(this_script)-1]
 
@@ -44,17 +41,53 @@ instructions = grave_digger.dig_instructions()
 # --- Start. ---
 toolbox.print_l('Started script @ ' + time.strftime('%Y%m%d-%H%M%S') + '.')
 
-# --- Establish a new "browser" session. ---
-# https://stackoverflow.com/questions/73688432/python-request-with-cookies-content-blocked-by-cookie-banner
-session = requests.Session()
-descriptor = 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML,'
-descriptor += ' like Gecko) Chrome/104.0.5112.79 Safari/537.36'
-headers = {
-	'User-Agent': descriptor
-}
-session.headers.update(headers)
-session.cookies.set("name", "notice_preferences", domain=cookie_domain)
-session.cookies.set( "value", "2:", domain=cookie_domain)
+# --- Request pacing. ---
+# "--fetchers N" requests N pages at a time, within "--rps R" requests per
+# second overall and "--host_rps R" per host (defaults to rps).
+fetchers = int(toolbox.get_option('fetchers', 1))
+if fetchers > 1 :
+	rps = float(toolbox.get_option('rps', 1))
+	toolbox.set_rate(rps, float(toolbox.get_option('host_rps', rps)))
+	toolbox.print_l('Fetching ' + str(fetchers) + ' pages at a time, ' + 
+		str(rps) + ' requests per second.')
+
+# --- Adaptive pacing. ---
+# "--pace C" tunes the request rate to how the site responds, speeding up
+# while it's quick & backing off when it slows or pushes back, never more
+# than C requests per second. Replaces rps, host_rps & the fixed pauses.
+pace = toolbox.get_option('pace', None)
+if None != pace :
+	toolbox.set_pacer(float(pace))
+	toolbox.print_l('Adaptive pacing, at most ' + str(pace) + 
+		' requests per second.')
+
+# --- Establish a new "browser" session, a connection per fetcher. ---
+session = toolbox.new_session(cookie_domain, fetchers)
+
+# --- HTTP cache. ---
+# "--http_cache H" answers requests any script made in the last H hours from
+# the stash's http_cache.db, at most "--http_cache_size MB" (default 500).
+http_cache = toolbox.get_option('http_cache', None)
+if None != http_cache :
+	toolbox.open_http_cache(path_to_stash, float(http_cache), 
+		float(toolbox.get_option('http_cache_size', 500)))
+
+# --- Incremental stashing. ---
+# "--incremental" only stashes burials added since the last run (and their
+# family), removes pages of burials no longer listed & keeps everything else.
+incremental = toolbox.get_option('incremental', False)
+added_files = []  # Master index changes, incremental only.
+removed_files = []
+
+# --- Multi-hop family. ---
+# "--hops N" also stashes family of family, up to N hops from the burials,
+# see grave_digger.crawl_frontier(). 1 (default) = burial family only.
+hops = int(toolbox.get_option('hops', 1))
+
+# --- Build the master list (once, kept up to date while stashing). ---
+# Burial group lists created in grave_digger.find_burial_urls().
+# Other group lists created in stash_graves().
+grave_digger.build_master_list()
 
 # --- Digging instructions. ---
 for cemetery_id, groups in instructions.items() : # Loop cemeteries.
@@ -67,10 +100,14 @@ for cemetery_id, groups in instructions.items() : # Loop cemeteries.
 	cemetery_url = 'https://findagrave.com/cemetery/' + cemetery_id
 	request = toolbox.get_url(session, cemetery_url)  # Get page.
 	toolbox.print_l()  # User status - readability.
+	if False == request :  # Retries ran out.
+		toolbox.print_l('Error: cemetery ' + cemetery_url + 
+			' could not be requested. Skipping it.')
+		continue
 	toolbox.print_l('Cemetery validated: ' + cemetery_url)
 
 	# --- Cemetery vars. ---
-	soup = BeautifulSoup(request.text, 'html.parser')
+	soup = grave_digger.make_soup(request.text)
 	cemetery_name = grave_digger.soup_find(soup, 'cemetery_name')
 	cemetery_name = cemetery_name.rstrip().lstrip().lower().replace(' ', '-')
 	cemetery_slug = cemetery_id + '_' + cemetery_name
@@ -82,6 +119,13 @@ for cemetery_id, groups in instructions.items() : # Loop cemeteries.
 		if 'burial' not in groups :
 			groups.insert(0, 'burial')  # Will need to find burials.
 		time.sleep(1)
+	if incremental and 'burial' not in groups :
+		groups.insert(0, 'burial')  # Will need added & removed burials.
+	burial_urls = []
+	added_burials = []
+	removed_burials = []
+	frontier = []  # Family pages to expand, multi-hop only.
+	group_pages = {}  # Family pages kept, stale pages removed after the crawl.
 
 	# --- File & folder path dictionaries. ---
 	path_to_list = {
@@ -121,24 +165,40 @@ for cemetery_id, groups in instructions.items() : # Loop cemeteries.
 		start_time = time.strftime('%Y%m%d-%H%M%S')
 		toolbox.print_l('Started group ' + group + ' @ ' + start_time + '.')
 				
-		# --- New group folder & folder list.  ---
-		if os.path.isdir(path_to_folder[group]) :  # Folder exists?
-			shutil.rmtree(path_to_folder[group])  # Remove.
-		os.mkdir(path_to_folder[group])  # New folder.
-		if os.path.isfile(path_to_list[group]) :  # List exists?
+		# --- Group folder & new folder list.  ---
+		# Stashed pages are kept & revalidated, see stash_group_pages().
+		if not os.path.isdir(path_to_folder[group]) :  # Folder exists?
+			os.mkdir(path_to_folder[group])  # New folder.
+		old_list = grave_digger.read_url_list(path_to_list[group])
+		if os.path.isfile(path_to_list[group]) and not incremental and \
+			'burial' != group :  # Burial list, once the search worked.
 			os.remove(path_to_list[group])  # Remove list.
-
-		# --- Build a new master list. ---
-		# Burial group list created in grave_digger.find_burial_urls().
-		# Other group lists created in stash_graves().
-		master_list_of_urls = grave_digger.build_master_list()
-		time.sleep(1)
+			# Drop this list's URLs from the master list.
+			grave_digger.forget_master_ids(path_to_list[group], 
+				[grave_digger.url_memorial_id(url) for url in old_list])
 
 		# --- Get "burial" group list. ---
 		if 'burial' == group :
 			args = [session, cemetery_id, path_to_list, group]
-			# Fill a new burial list.
-			burial_urls = grave_digger.find_burial_urls(args)
+			if incremental :  # Compare with the last burial list.
+				# The list is saved when the cemetery is done, so an interrupted
+				# run finds the same added & removed burials again.
+				burial_urls = grave_digger.search_burial_urls(session, 
+					cemetery_id)
+			else :  # Fill a new burial list.
+				burial_urls = grave_digger.find_burial_urls(args)
+			if False == burial_urls :  # A partial list would drop burials.
+				toolbox.print_l('Error: burial search failed. Skipping cemetery "'
+					+ cemetery_id + '", run again to retry.')
+				break
+			if incremental :
+				added_burials, removed_burials = grave_digger.diff_urls(
+					old_list, burial_urls)
+				toolbox.print_l(str(len(added_burials)) + ' burials added, ' + 
+					str(len(removed_burials)) + ' removed.')
+			else :  # New list written, drop the old one from the master list.
+				grave_digger.forget_master_ids(path_to_list[group], 
+					[grave_digger.url_memorial_id(url) for url in old_list])
 			num_burials = len(burial_urls)
 		else :
 			if 0 == len(burial_urls) :  # Get the list only once.
@@ -147,52 +207,82 @@ for cemetery_id, groups in instructions.items() : # Loop cemeteries.
 				f.close()
 				num_burials = len(burial_urls)
 		
-		# --- # Loop burial URLs & stash pages for this group. ---
+		# --- Find pages to stash for this group. ---
 		toolbox.print_l()  # Blank line for better readabiity.
-		if 'burial' != group :
-				toolbox.print_l('Searching ' + str(len(burial_urls)) + 
-		  			' burials in cemetery "' + cemetery_id + '", retrieving "' 
-					+ group + '" pages ...')
-				f = open(path_to_list[group], 'w')  # Open family list file.
-		this_burial = 1
-		for burial_url in burial_urls :  
-			if 'burial' == group :
-				# Stash "burial" page.
-				toolbox.print_l('Saving ' + str(this_burial) + ' of ' + 
-					str(num_burials) + ' "burial" pages - ' + burial_url)
-				args = [session, group, burial_url, '', path_to_folder]
-				grave_digger.stash_group_page(args)
-			else :
-				# Stash "family" pages.
-				toolbox.print_l(str(this_burial) + ' of ' + str(num_burials) 
-		 			+ ' "burial" pages - ' + burial_url)  # User status.
-				burial_slug = burial_url.split('/memorial/')[1]
-				burial_slug = burial_slug.replace('\\', '_')
-				burial_page = path_to_folder['burial'] + '\\' + \
-					burial_slug + '.html'
-				# Make burial soup.
-				toolbox.print_l('- ' + burial_url)
-				f_b = open(burial_page, 'r', encoding = 'utf8')
-				soup = BeautifulSoup(f_b, 'html.parser')
-				# Find "group" URLs for this burial.
-				family_urls = grave_digger.find_family_urls(group, soup)
+		jobs = []  # [burial_url, family_url], family_url is '' for burials.
+		group_burials = burial_urls
+		if incremental :
+			group_burials = added_burials
+		if 'burial' == group :
+			for burial_url in group_burials :
+				jobs.append([burial_url, ''])
+		else :
+			toolbox.print_l('Searching ' + str(len(group_burials)) + 
+				' burials in cemetery "' + cemetery_id + '", retrieving "' 
+				+ group + '" pages ...')
+			queued = set()  # Memorial IDs already queued for this group.
+			this_burial = 1
+			for burial_url in group_burials :  
+				toolbox.print_l(str(this_burial) + ' of ' + str(len(group_burials)) 
+					+ ' "burial" pages - ' + burial_url)  # User status.
+				burial_page = grave_digger.group_page_name([session, 'burial', 
+					burial_url, '', path_to_folder])
+				burial_page = grave_digger.stash_file(burial_page)
+				this_burial +=1
+				if not os.path.isfile(burial_page) :  # Failed fetch, journaled.
+					continue
+				# Find "group" URLs for this burial. The page is parsed once for
+				# all groups, later groups (& runs) use the fact cache.
+				family_urls = grave_digger.page_family_urls(burial_page)[group]
 				# Loop "group" URLs.
 				for family_url in family_urls :
-					# If not a duplicate URL, stash the page.
-					if family_url not in master_list_of_urls :
-						args = [session, group, burial_url, family_url, 
-							path_to_folder]
-						# Stash page.
-						grave_digger.stash_group_page(args)
-						# Update family list.
-						f.write(family_url + '\n')
-			this_burial +=1
-
-		# --- Close & tweak group list. ---
+					# If not a duplicate memorial, queue the page.
+					family_id = grave_digger.url_memorial_id(family_url)
+					if not grave_digger.is_master_url(family_url) and \
+						family_id not in queued :
+						jobs.append([burial_url, family_url])
+						queued.add(family_id)
+
+		# --- Stash pages for this group. ---
+		# Journaled, an interrupted run picks up where it stopped.
+		pages = grave_digger.stash_group_pages(session, group, jobs, 
+			path_to_folder, fetchers, cemetery_id)
+		if hops > 1 and 'burial' != group :
+			for i in range(len(pages)) :
+				heapq.heappush(frontier, [1, len(frontier), jobs[i][1], pages[i], 
+					jobs[i][0]])
+
+		# --- Remove pages no longer in this group. ---
+		if incremental :  # Pages of removed burials.
+			removed = grave_digger.remove_pages_of(path_to_folder[group], 
+				group, removed_burials)
+			removed += grave_digger.remove_crawled_of(cemetery_id, group, 
+				removed_burials)  # Family of family, see crawl_frontier().
+			grave_digger.forget_master_ids(path_to_list[group], 
+				[grave_digger.memorial_id(file_name) for file_name in removed])
+			added_files += [grave_digger.stash_file(page) for page in pages]
+			removed_files += removed
+		elif hops > 1 and 'burial' != group :  # After the crawl.
+			group_pages[group] = pages
+			removed = []
+		else :
+			removed = grave_digger.remove_stale_pages(path_to_folder[group], 
+				pages)
+		if len(removed) > 0 :
+			toolbox.print_l('Removed ' + str(len(removed)) + ' old ' + group + 
+				' pages.')
+
+		# --- Write group list. ---
 		if 'burial' != group :
-			f.close()
-			# Remove dangling "\n".
-			toolbox.remove_last_byte(f, path_to_list[group])
+			family_list = []
+			if incremental :  # Keep listed pages still stashed.
+				stashed = grave_digger.stashed_ids(path_to_folder[group])
+				for family_url in old_list :
+					if grave_digger.url_memorial_id(family_url) in stashed :
+						family_list.append(family_url)
+			for job in jobs :
+				family_list.append(job[1])
+			grave_digger.write_url_list(path_to_list[group], family_list)
 
 		# --- Save the new master list. ---
 		grave_digger.save_master_list()
@@ -205,11 +295,57 @@ for cemetery_id, groups in instructions.items() : # Loop cemeteries.
 		# Try to avoid looking like a DOS attack on the Find a Grave site.
 		toolbox.print_l('Finished group ' + group + ' @ ' + 
 			time.strftime('%Y%m%d-%H%M%S') + '.')
+		if None != pace :
+			toolbox.print_l('Request rate now ' + 
+				str(round(toolbox.current_rate(), 2)) + ' per second.')
 		if list(groups).index(group) < len(groups)-1 :
 			toolbox.pause(10, 15, True)
 
-# --- Create master index. ---
-grave_digger.build_master_index()
+	# --- Burial search failed, see above. ---
+	if False == burial_urls :
+		continue
+
+	# --- Family more than one hop out. ---
+	if hops > 1 :
+		crawled = grave_digger.crawl_frontier(session, frontier, hops, groups, 
+			path_to_folder, fetchers, cemetery_id)
+		for group, (jobs, pages) in crawled.items() :
+			family_list = grave_digger.read_url_list(path_to_list[group])
+			family_list += [job[1] for job in jobs]
+			grave_digger.write_url_list(path_to_list[group], family_list)
+			if incremental :
+				added_files += [grave_digger.stash_file(page) for page in pages]
+			elif group in group_pages :
+				removed = grave_digger.remove_stale_pages(path_to_folder[group], 
+					group_pages[group] + pages)
+				if len(removed) > 0 :
+					toolbox.print_l('Removed ' + str(len(removed)) + ' old ' + 
+						group + ' pages.')
+		grave_digger.save_master_list()
+
+	# --- Incremental burial list, saved once all groups are done. ---
+	if incremental :
+		grave_digger.write_url_list(path_to_list['burial'], burial_urls)
+
+	# --- Finish crawl journal. ---
+	failed = grave_digger.finish_journal(cemetery_id)
+	if failed > 0 :
+		toolbox.print_l(str(failed) + ' pages failed for cemetery "' + 
+			cemetery_id + '". Run again to retry them.')
+
+# --- Page store clean up. ---
+if 'cas' == toolbox.get_option('page_store', 'files') :
+	removed = grave_digger.sweep_page_store()
+	toolbox.print_l('Removed ' + str(removed) + ' unused page store bodies.')
+
+# --- Create (or update) master index. ---
+if incremental :
+	grave_digger.update_master_index(added_files, removed_files)
+else :
+	grave_digger.build_master_index()
+grave_digger.close_stash_db()
+grave_digger.close_fact_cache()
+toolbox.close_http_cache()
 
 # --- Wrap up. ---
 toolbox.print_l()  # User status - readability.
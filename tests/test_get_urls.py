@@ -0,0 +1,139 @@
+# ------------------------------------------------\
+#  Tests for toolbox.get_urls() against a local stub server.
+#  Last update: 2026/10/18 @ 11:59pm.
+#
+#  Name:               test_get_urls.py
+#  URI:                https://github.com/doug-foster/find-a-grave-tools
+#  Description:	       Tests for toolbox.get_urls() against a local stub server
+#  Version:            1.2.3
+#  Requires at least:  3.1 Python
+#  Prefers:            3.12 Python
+#  Author:             Doug Foster
+#  Author URI:         http://dougfoster.me
+#  License:            GPL v3 or later
+#  License URI:        https://www.gnu.org/licenses/agpl-3.0.html
+#  Update URI:         https://github.com/doug-foster/find-a-grave-tools
+#  Text Domain:        find-a-grave-tools
+#
+#  Run from the repository folder:
+#   python -m unittest discover tests
+#  The stub server answers "/page/N" with "page N" after a random delay,
+#  so responses finish out of order, & counts requests in flight.
+# ------------------------------------------------\
+
+# --- Import libraries. ---
+# Standard Libraries.
+import os  # https://docs.python.org/3/library/os.html
+import sys  # https://docs.python.org/3/library/sys.html
+import time  # https://docs.python.org/3/library/time.html
+import random  # https://docs.python.org/3/library/random.html
+import threading  # https://docs.python.org/3/library/threading.html
+import unittest  # https://docs.python.org/3/library/unittest.html
+import http.server  # https://docs.python.org/3/library/http.server.html
+# Packages.
+import requests  # https://pypi.org/project/requests/
+# My modules.
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import toolbox  # https://github.com/doug-foster/find-a-grave-tools
+
+# --- Globals. ---
+stub = {'in_flight' : 0, 'most' : 0, 'lock' : threading.Lock()}
+
+
+# --------------------------------------------\
+#  Stub "Find a Grave" server, one thread per request.
+#  Last update: 2026/10/18 @ 11:59pm.
+# --------------------------------------------\
+class StubHandler(http.server.BaseHTTPRequestHandler) :
+
+	def do_GET(self) :
+
+		# --- Count requests in flight. ---
+		with stub['lock'] :
+			stub['in_flight'] += 1
+			stub['most'] = max(stub['most'], stub['in_flight'])
+
+		# --- Answer, slowly. ---
+		time.sleep(random.uniform(0, 0.05))
+		body = ('page ' + self.path.rsplit('/', 1)[-1]).encode()
+		self.send_response(200)
+		self.send_header('Content-Length', str(len(body)))
+		self.end_headers()
+		self.wfile.write(body)
+		with stub['lock'] :
+			stub['in_flight'] -= 1
+
+	def log_message(self, *args) :
+		pass  # Quiet.
+# --------------------------------------------/
+
+
+# --------------------------------------------\
+#  toolbox.get_urls() ordering, concurrency & rate limits.
+#  Last update: 2026/10/18 @ 11:59pm.
+# --------------------------------------------\
+class TestGetUrls(unittest.TestCase) :
+
+	@classmethod
+	def setUpClass(cls) :
+		cls.server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), StubHandler)
+		threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+		cls.base = 'http://127.0.0.1:' + str(cls.server.server_port)
+		cls.print_l = toolbox.print_l
+		toolbox.print_l = lambda *args, **kwargs : None  # Quiet.
+
+	@classmethod
+	def tearDownClass(cls) :
+		cls.server.shutdown()
+		cls.server.server_close()
+		toolbox.print_l = cls.print_l
+
+	def setUp(self) :
+		self.session = requests.Session()
+		stub['in_flight'] = 0
+		stub['most'] = 0
+		toolbox.set_rate()  # No limit.
+
+	def tearDown(self) :
+		self.session.close()
+		toolbox.set_rate()
+
+	def urls(self, count) :
+		return [self.base + '/page/' + str(n) for n in range(count)]
+
+	def test_order(self) :
+		urls = self.urls(30)
+		results = list(toolbox.get_urls(self.session, urls, 6))
+		self.assertEqual([url for url, request in results], urls)
+		for n in range(len(results)) :
+			self.assertEqual(results[n][1].text, 'page ' + str(n))
+
+	def test_workers_bound_concurrency(self) :
+		list(toolbox.get_urls(self.session, self.urls(30), 4))
+		self.assertLessEqual(stub['most'], 4)
+		self.assertGreater(stub['most'], 1)  # Did run concurrently.
+
+	def test_global_rate(self) :
+		toolbox.set_rate(20)  # 20 requests per second, burst of 1.
+		start = time.monotonic()
+		list(toolbox.get_urls(self.session, self.urls(21), 8))
+		self.assertGreaterEqual(time.monotonic() - start, 0.95)  # 20 waits.
+
+	def test_host_rate(self) :
+		toolbox.set_rate(None, 10)  # 10 per second for the one host.
+		start = time.monotonic()
+		list(toolbox.get_urls(self.session, self.urls(11), 8))
+		self.assertGreaterEqual(time.monotonic() - start, 0.95)  # 10 waits.
+
+	def test_no_limit_is_fast(self) :
+		start = time.monotonic()
+		list(toolbox.get_urls(self.session, self.urls(21), 8))
+		self.assertLess(time.monotonic() - start, 0.95)
+# --------------------------------------------/
+
+
+# --- Main. ---
+if '__main__' == __name__ :
+	unittest.main()
+
+# ------------------------------------------------/
@@ -24,12 +24,46 @@ import random  # https://docs.python.org/3/library/random.html
 import re  # https://docs.python.org/3/library/re.html
 import inspect  # https://docs.python.org/3/library/inspect.html
 import html  # https://docs.python.org/3/library/html.html
+import sys  # https://docs.python.org/3/library/sys.html
+import threading  # https://docs.python.org/3/library/threading.html
+import collections  # https://docs.python.org/3/library/collections.html
+from concurrent.futures import ThreadPoolExecutor  # https://docs.python.org/3/library/concurrent.futures.html
+import json  # https://docs.python.org/3/library/json.html
+import sqlite3  # https://docs.python.org/3/library/sqlite3.html
+import zlib  # https://docs.python.org/3/library/zlib.html
+from email.utils import parsedate_to_datetime  # https://docs.python.org/3/library/email.utils.html
+from urllib.parse import urlsplit  # https://docs.python.org/3/library/urllib.parse.html
+from urllib.parse import urlunsplit  # https://docs.python.org/3/library/urllib.parse.html
 # Packages.
+import requests  # https://pypi.org/project/requests/
+from requests.adapters import HTTPAdapter  # https://requests.readthedocs.io/en/latest/api/#requests.adapters.HTTPAdapter
 # My modules.
 
 # --- Globals. ---
 path_to_instructions = 'instructions/'
 log_file = None
+options = {}  # Options from instruction files, see get_option().
+rate_limits = {'rps' : None, 'host_rps' : None, 'burst' : 1.0}  # See set_rate().
+token_buckets = {}  # { host : [tokens, time] }, '*' is the global bucket.
+rate_lock = threading.Lock()
+http_cache_db = 'http_cache.db'  # Responses shared by all scripts.
+http_cache = None  # Open cache, see open_http_cache().
+http_cache_limits = {'ttl' : 0, 'size' : 0, 'used' : 0}  # Seconds & bytes.
+http_cache_lock = threading.Lock()
+retry_limits = {'base' : 2.0, 'cap' : 60.0, 'timeout' : 30.0}  # Seconds.
+retry_policies = {  # Status : retries, see retry_policy().
+	403 : 1, 404 : 0, 410 : 0,  # Forbidden, not found, gone.
+	408 : 4, 429 : 6, 500 : 2, 502 : 4, 503 : 6, 504 : 4,
+	'timeout' : 3, 'connection' : 3  # No response at all.
+}
+pushback = [429, 503, 'timeout']  # Site is overloaded, see trip_breaker().
+gone_status = [404, 410]  # Page is gone for good, see get_url() gone.
+pacer = {'on' : False, 'rate' : 1.0, 'floor' : 0.1, 'ceiling' : 2.0,
+	'step' : 0.05, 'factor' : 0.5, 'target' : 2.0, 'latency' : 0.0, 
+	'cut' : 0.0}  # Adaptive request rate, see set_pacer().
+breaker = {'strikes' : 0, 'threshold' : 5, 'cooldown' : 60.0, 'until' : 0.0}
+user_agent = 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML,'
+user_agent += ' like Gecko) Chrome/104.0.5112.79 Safari/537.36'
 
 # --- Functions. ---
 # pause(low, high, status)
@@ -37,11 +71,29 @@ log_file = None
 # remove_last_byte(f, path)
 # print_l(string, end)
 # log(start)
-# get_url(session, url)
+# set_rate(rps, host_rps, burst)
+# take_token(url)
+# set_pacer(ceiling, rate, target)
+# pace(seconds, healthy)
+# current_rate()
+# open_http_cache(path, hours, megabytes)
+# close_http_cache()
+# cache_key(url)
+# cache_get(url)
+# cache_put(url, request)
+# new_session(cookie_domain, fetchers)
+# retry_policy(status)
+# retry_wait(attempt, request)
+# retry_after(request)
+# trip_breaker(pushed, wait)
+# breaker_wait()
+# get_url(session, url, headers, gone)
+# get_urls(session, urls, workers, headers, gone)
+# get_option(name, default)
 
 # --------------------------------------------\
 #  Pause a random amount of time.
-#  Last update: 2024/05/28 @ 01:45pm.
+#  Last update: 2026/10/18 @ 11:59pm.
 #
 #  Low & high are seconds.
 #  Helpful for rate pacing.
@@ -54,8 +106,8 @@ def pause(low:float = 0, high:float = 2.0, status:bool = False) :
 		return False
 	
 	# --- Vars. ---
-	min = int(low)*100
-	max = int(high)*100
+	min = int(round(low*100))  # Hundredths, e.g. 0.5 = 50.
+	max = int(round(high*100))
 
 	# --- Calculate pause time. ---
 	pause_time = round(random.randint(min,max)/100, 2)
@@ -155,31 +207,567 @@ def log(start:bool = True) :
 # --------------------------------------------/
 
 
+# --------------------------------------------\
+#  Set the request rate budget used by get_url().
+#  Last update: 2026/10/18 @ 04:00pm.
+#
+#  rps = requests per second for all hosts, host_rps = per host.
+#  burst = requests allowed back-to-back after an idle spell.
+#  None (the default) means no limit, callers pace themselves.
+# --------------------------------------------\
+def set_rate(rps = None, host_rps = None, burst:float = 1.0) :
+
+	# --- Set limits & start with fresh buckets. ---
+	with rate_lock :
+		rate_limits['rps'] = rps
+		rate_limits['host_rps'] = host_rps
+		rate_limits['burst'] = max(1.0, burst)
+		token_buckets.clear()
+# --------------------------------------------/
+
+
+# --------------------------------------------\
+#  Turn on adaptive pacing, the request rate follows the site's health.
+#  Last update: 2026/10/18 @ 11:59pm.
+#
+#  AIMD: every healthy, quick response adds "step" requests per second (up
+#  to ceiling); a slow response (average over "target" seconds), 429, 5xx
+#  or timeout halves the rate (down to "floor"), at most once a round trip.
+#  The rate is the global budget of take_token(), see current_rate(). The
+#  per-host limit (set_rate() host_rps) is cleared, the pacer replaces it.
+#  ceiling = most requests per second ever made, rate = starting rate
+#  (default half the ceiling), target = response seconds considered slow.
+# --------------------------------------------\
+def set_pacer(ceiling:float = 2.0, rate = None, target:float = 2.0) :
+
+	# --- Vars. ---
+	if None == rate :
+		rate = ceiling / 2
+
+	# --- Start pacing. ---
+	with rate_lock :
+		pacer['on'] = True
+		pacer['ceiling'] = ceiling
+		pacer['floor'] = min(pacer['floor'], ceiling)
+		pacer['rate'] = max(pacer['floor'], min(ceiling, rate))
+		pacer['target'] = target
+		pacer['latency'] = 0.0
+		rate_limits['rps'] = pacer['rate']
+		rate_limits['host_rps'] = None  # One site, the pacer is the limit.
+# --------------------------------------------/
+
+
+# --------------------------------------------\
+#  Adjust the adaptive pacer for one response.
+#  Last update: 2026/10/18 @ 11:59pm.
+#
+#  seconds = how long the request took, healthy = False for a pushback
+#  (429, 5xx, timeout, no connection). Does nothing unless set_pacer().
+# --------------------------------------------\
+def pace(seconds:float, healthy:bool) :
+
+	# --- Vars. ---
+	now = time.monotonic()
+
+	# --- Additive increase, multiplicative decrease. ---
+	with rate_lock :
+		if not pacer['on'] :
+			return
+		if 0 == pacer['latency'] :
+			pacer['latency'] = seconds
+		else :  # Moving average.
+			pacer['latency'] = 0.8 * pacer['latency'] + 0.2 * seconds
+		if healthy and pacer['latency'] <= pacer['target'] :
+			pacer['rate'] = min(pacer['ceiling'], pacer['rate'] + pacer['step'])
+		elif now - pacer['cut'] >= pacer['latency'] + 1 / pacer['rate'] :
+			pacer['rate'] = max(pacer['floor'], pacer['rate'] * pacer['factor'])
+			pacer['cut'] = now
+		rate_limits['rps'] = pacer['rate']
+# --------------------------------------------/
+
+
+# --------------------------------------------\
+#  Return the current request rate, requests per second (None = no limit).
+#  Last update: 2026/10/18 @ 11:59pm.
+# --------------------------------------------\
+def current_rate() :
+
+	# --- Global budget. ---
+	with rate_lock :
+		return rate_limits['rps']
+# --------------------------------------------/
+
+
+# --------------------------------------------\
+#  Wait for a token from the global & per-host token buckets.
+#  Last update: 2026/10/18 @ 04:00pm.
+#
+#  Thread safe. Buckets refill at their rate up to "burst" tokens.
+# --------------------------------------------\
+def take_token(url) :
+
+	# --- Vars. ---
+	host = urlsplit(url).netloc
+
+	# --- Wait until both buckets have a token. ---
+	while True :
+		with rate_lock :
+			now = time.monotonic()
+			wait = 0
+			buckets = []
+			for key, rate in (('*', rate_limits['rps']), 
+				(host, rate_limits['host_rps'])) :
+				if None == rate or rate <= 0 :  # No limit.
+					continue
+				bucket = token_buckets.setdefault(key, [rate_limits['burst'], now])
+				bucket[0] = min(rate_limits['burst'], 
+					bucket[0] + (now - bucket[1]) * rate)  # Refill.
+				bucket[1] = now
+				if bucket[0] < 1 :
+					wait = max(wait, (1 - bucket[0]) / rate)
+				buckets.append(bucket)
+			if 0 == wait :
+				for bucket in buckets :
+					bucket[0] -= 1  # Spend a token.
+				return
+		time.sleep(wait)
+# --------------------------------------------/
+
+
+# --------------------------------------------\
+#  Open the HTTP response cache.
+#  Last update: 2026/10/18 @ 11:59pm.
+#
+#  path = folder of http_cache.db, e.g. the stash, so every script shares it.
+#  hours = how long a cached response is reused.
+#  megabytes = cache size, least recently used responses go first.
+#  Once open, get_url() answers repeat requests from the cache.
+# --------------------------------------------\
+def open_http_cache(path, hours:float = 24, megabytes:float = 500) :
+
+	# --- Vars. ---
+	global http_cache
+
+	# --- Open (or create) cache. ---
+	with http_cache_lock :
+		if None != http_cache :
+			return http_cache
+		http_cache = sqlite3.connect(path + http_cache_db, timeout=30,
+			isolation_level=None, check_same_thread=False)  # Autocommit.
+		http_cache.execute('PRAGMA journal_mode=WAL')
+		http_cache.execute('PRAGMA synchronous=NORMAL')
+		http_cache.execute('CREATE TABLE IF NOT EXISTS responses (url TEXT '
+			'PRIMARY KEY, fetched REAL, used REAL, status INTEGER, '
+			'headers TEXT, content BLOB, size INTEGER)')
+		http_cache.execute('CREATE INDEX IF NOT EXISTS responses_used '
+			'ON responses (used)')
+		http_cache_limits['ttl'] = hours * 3600
+		http_cache_limits['size'] = int(megabytes * 1024 * 1024)
+		http_cache.execute('DELETE FROM responses WHERE fetched < ?',
+			(time.time() - http_cache_limits['ttl'],))  # Expired.
+		used = http_cache.execute('SELECT SUM(size) FROM responses').fetchone()[0]
+		http_cache_limits['used'] = used or 0
+	return http_cache
+# --------------------------------------------/
+
+
+# --------------------------------------------\
+#  Close the HTTP response cache.
+#  Last update: 2026/10/18 @ 11:59pm.
+# --------------------------------------------\
+def close_http_cache() :
+
+	# --- Vars. ---
+	global http_cache
+
+	# --- Close cache. ---
+	with http_cache_lock :
+		if None != http_cache :
+			http_cache.close()
+			http_cache = None
+# --------------------------------------------/
+
+
+# --------------------------------------------\
+#  Return the cache key of a URL.
+#  Last update: 2026/10/18 @ 11:59pm.
+#
+#  e.g. "HTTP://FindAGrave.com/cemetery/123/?b=2&a=1#top" is
+#  "https://findagrave.com/cemetery/123?a=1&b=2", so the same page requested
+#  two ways is cached once.
+# --------------------------------------------\
+def cache_key(url) :
+
+	# --- Vars. ---
+	parts = urlsplit(url.strip())
+	host = parts.netloc.lower()
+	if host.startswith('www.') : host = host[4:]
+	query = '&'.join(sorted(part for part in parts.query.split('&') if '' != part))
+
+	# --- Return key. ---
+	return urlunsplit(('https', host, parts.path.rstrip('/'), query, ''))
+# --------------------------------------------/
+
+
+# --------------------------------------------\
+#  Return a cached response for a URL, None if not cached (or expired).
+#  Last update: 2026/10/18 @ 11:59pm.
+#
+#  A requests.Response, same as session.get() would return.
+# --------------------------------------------\
+def cache_get(url) :
+
+	# --- Vars. ---
+	key = cache_key(url)
+	now = time.time()
+
+	# --- Look up. ---
+	with http_cache_lock :
+		if None == http_cache :
+			return None
+		row = http_cache.execute('SELECT fetched, status, headers, content '
+			'FROM responses WHERE url = ?', (key,)).fetchone()
+		if None == row or row[0] < now - http_cache_limits['ttl'] :
+			return None
+		http_cache.execute('UPDATE responses SET used = ? WHERE url = ?',
+			(now, key))  # Recently used.
+
+	# --- Rebuild response. ---
+	response = requests.Response()
+	response.url = url
+	response.status_code = row[1]
+	response.reason = 'OK'
+	response.headers = requests.structures.CaseInsensitiveDict(json.loads(row[2]))
+	response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+	response._content = zlib.decompress(row[3])
+	return response
+# --------------------------------------------/
+
+
+# --------------------------------------------\
+#  Save a response to the HTTP cache.
+#  Last update: 2026/10/18 @ 11:59pm.
+#
+#  Content is saved decoded & compressed. When the cache (all scripts) is
+#  over size, least recently used responses are removed.
+# --------------------------------------------\
+def cache_put(url, request) :
+
+	# --- Vars. ---
+	key = cache_key(url)
+	now = time.time()
+	headers = {}
+	for header, value in request.headers.items() :
+		if header.lower() not in ['content-encoding', 'content-length',
+			'transfer-encoding', 'set-cookie'] :  # Not true of saved content.
+			headers[header] = value
+	headers = json.dumps(headers)
+	content = zlib.compress(request.content)
+	size = len(key) + len(headers) + len(content)
+
+	# --- Save. ---
+	with http_cache_lock :
+		if None == http_cache :
+			return
+		http_cache.execute('BEGIN')
+		http_cache.execute('INSERT OR REPLACE INTO responses VALUES '
+			'(?, ?, ?, ?, ?, ?, ?)', (key, now, now, request.status_code,
+			headers, content, size))
+
+		# --- Evict least recently used, a batch at a time. ---
+		# Scripts running at the same time share the cache, so the total
+		# comes from the database, not this process.
+		used = http_cache.execute('SELECT SUM(size) FROM responses').fetchone()[0]
+		while used > http_cache_limits['size'] :
+			rows = http_cache.execute('SELECT url, size FROM responses '
+				'WHERE url != ? ORDER BY used LIMIT 100', (key,)).fetchall()
+			if 0 == len(rows) :
+				break
+			for old_key, old_size in rows :
+				if used <= http_cache_limits['size'] : break
+				http_cache.execute('DELETE FROM responses WHERE url = ?',
+					(old_key,))
+				used -= old_size
+		http_cache_limits['used'] = used
+		http_cache.execute('COMMIT')
+# --------------------------------------------/
+
+
+# --------------------------------------------\
+#  Return a new "browser" session.
+#  Last update: 2026/10/18 @ 11:59pm.
+#
+#  One session is shared by every fetch (& get_urls() thread), connections
+#  are kept alive & reused. The pool holds a connection per fetcher, so
+#  concurrent requests never wait for (or throw away) a connection.
+#  Compressed responses: gzip & deflate, plus br (brotli) when the brotli
+#  package is installed. requests speaks HTTP/1.1 only.
+#  cookie_domain = accept the site's cookie notice, see grave_digger.
+# --------------------------------------------\
+def new_session(cookie_domain = None, fetchers:int = 1) :
+
+	# --- Vars. ---
+	# https://stackoverflow.com/questions/73688432/python-request-with-cookies-content-blocked-by-cookie-banner
+	session = requests.Session()
+	pool = max(10, fetchers)  # 10 = requests default.
+	adapter = HTTPAdapter(pool_connections = pool, pool_maxsize = pool)
+
+	# --- Set up. ---
+	session.mount('https://', adapter)
+	session.mount('http://', adapter)
+	session.headers.update({
+		'User-Agent' : user_agent,
+		'Accept-Encoding' : requests.utils.DEFAULT_ACCEPT_ENCODING,
+		'Connection' : 'keep-alive'
+	})
+	if None != cookie_domain :
+		session.cookies.set("name", "notice_preferences", domain=cookie_domain)
+		session.cookies.set( "value", "2:", domain=cookie_domain)
+	return session
+# --------------------------------------------/
+
+
+# --------------------------------------------\
+#  Return how many times to retry a request that failed with a status.
+#  Last update: 2026/10/18 @ 11:59pm.
+#
+#  status = HTTP status code, 'timeout' or 'connection' (no response).
+#  See retry_policies, others: 4xx = 0 (asking again won't help), 5xx = 2.
+# --------------------------------------------\
+def retry_policy(status) :
+
+	# --- Listed? ---
+	if status in retry_policies :
+		return retry_policies[status]
+
+	# --- By class. ---
+	if isinstance(status, int) and 500 <= status :
+		return 2
+	return 0
+# --------------------------------------------/
+
+
+# --------------------------------------------\
+#  Return the seconds to wait before retrying a request.
+#  Last update: 2026/10/18 @ 11:59pm.
+#
+#  Exponential backoff with (full) jitter: a random time up to base x 2^attempt
+#  seconds, at most cap, so fetchers that failed together don't retry together.
+#  A Retry-After header from the site wins if it asks for longer.
+# --------------------------------------------\
+def retry_wait(attempt, request = None) :
+
+	# --- Vars. ---
+	ceiling = min(retry_limits['cap'], retry_limits['base'] * 2 ** attempt)
+	wait = round(random.uniform(0, ceiling), 2)
+
+	# --- Site asked for a wait? ---
+	after = retry_after(request)
+	if None != after :
+		wait = max(wait, after)
+	return wait
+# --------------------------------------------/
+
+
+# --------------------------------------------\
+#  Return the seconds a response's Retry-After header asks for, None if none.
+#  Last update: 2026/10/18 @ 11:59pm.
+#
+#  e.g. "Retry-After: 120" or "Retry-After: Wed, 21 Oct 2026 07:28:00 GMT".
+#  At most 10 minutes.
+# --------------------------------------------\
+def retry_after(request) :
+
+	# --- Vars. ---
+	if None == request :
+		return None
+	value = request.headers.get('Retry-After', '').strip()
+	if '' == value :
+		return None
+
+	# --- Seconds or a date. ---
+	if value.isdigit() :
+		seconds = float(value)
+	else :
+		try :
+			seconds = parsedate_to_datetime(value).timestamp() - time.time()
+		except (TypeError, ValueError) :
+			return None
+	return min(max(0.0, seconds), 600.0)
+# --------------------------------------------/
+
+
+# --------------------------------------------\
+#  Count a response toward the circuit breaker.
+#  Last update: 2026/10/18 @ 11:59pm.
+#
+#  pushed = the site pushed back (429, 503, timeout), see pushback.
+#  After "threshold" pushbacks in a row the breaker opens: every fetcher
+#  waits (breaker_wait()) for the cooldown, or longer if the site asked.
+#  Any other response closes it again.
+# --------------------------------------------\
+def trip_breaker(pushed:bool, wait:float = 0) :
+
+	# --- Count. ---
+	with rate_lock :
+		if not pushed :
+			breaker['strikes'] = 0
+			return
+		breaker['strikes'] += 1
+		if breaker['strikes'] < breaker['threshold'] :
+			return
+		breaker['strikes'] = 0
+		pause_time = max(breaker['cooldown'], wait)
+		breaker['until'] = max(breaker['until'], time.monotonic() + pause_time)
+	print_l('Site is pushing back. All requests pause for ' + 
+		str(round(pause_time)) + ' seconds.')
+# --------------------------------------------/
+
+
+# --------------------------------------------\
+#  Wait while the circuit breaker is open.
+#  Last update: 2026/10/18 @ 11:59pm.
+# --------------------------------------------\
+def breaker_wait() :
+
+	# --- Wait. ---
+	while True :
+		with rate_lock :
+			wait = breaker['until'] - time.monotonic()
+		if wait <= 0 :
+			return
+		time.sleep(wait)
+# --------------------------------------------/
+
+
 # --------------------------------------------\
 #  Given an open session, request a URL.
-#  Last update: 2024/05/28 @ 10:30am.
+#  Last update: 2026/10/18 @ 11:59pm.
+#
+#  headers = extra request headers, e.g. If-None-Match for a conditional
+#  request, in which case a 304 (not modified) response is also returned.
+#  Conditional requests skip the HTTP cache (see open_http_cache()), they
+#  are asking the site itself whether a page changed.
+#  Failures are retried per retry_policy(), waiting retry_wait() between
+#  tries. "--timeout S" = seconds to wait for the site (default 30).
+#  Every response (not cache hits) feeds the pacer, see set_pacer().
+#  Returns False when retries run out, the caller decides what to do.
+#  gone = True returns the status (404 or 410, see gone_status) instead of
+#  False for a page that is gone for good, no use asking again.
 # --------------------------------------------\
-def get_url(session, url) :
+def get_url(session, url, headers = None, gone:bool = False) :
 
 	# --- Vars. ---
-	tries = 3
+	attempt = 0
+	timeout = float(get_option('timeout', retry_limits['timeout']))
+
+	# --- Cached? ---
+	if None == headers and None != http_cache :
+		request = cache_get(url)
+		if None != request :
+			return request
 
 	# --- Request URL. ---
-	while tries > 0 :  # Multiple request tries needed?
-		request = session.get(url)
-		if request.status_code == 200 :  # Request worked.
+	while True :
+		breaker_wait()  # Site pushed back, see trip_breaker().
+		take_token(url)  # Rate budget, see set_rate().
+		start = time.monotonic()
+		try :
+			request = session.get(url, headers = headers, timeout = timeout)
+			status = request.status_code
+		except requests.exceptions.Timeout :
+			request = None
+			status = 'timeout'
+		except requests.exceptions.RequestException :  # DNS, refused, reset, ...
+			request = None
+			status = 'connection'
+		pace(time.monotonic() - start, isinstance(status, int) and 
+			status < 500 and 429 != status)
+		if 200 == status :  # Request worked.
+			trip_breaker(False)
+			if None == headers and None != http_cache :
+				cache_put(url, request)
 			return request
-		else :
-			print_l('Error: ' + url)
-			tries -= 1
-			if 0 == tries :
-				print_l('No retries remain. Giving up. Early exit.')
-				quit()
-			else :
-				print_l(str(tries) + ' retries remaining. Trying again. ')
-				pause(3, 5, True)  # Pause.
-	
-	return False
+		if 304 == status and None != headers :  # Not modified.
+			trip_breaker(False)
+			return request
+
+		# --- Retry? ---
+		retries = retry_policy(status)
+		wait = retry_wait(attempt, request)
+		trip_breaker(status in pushback, wait)
+		print_l('Error: ' + str(status) + ' ' + url)
+		if gone and status in gone_status :
+			return status
+		if attempt >= retries :
+			print_l('No retries remain. Giving up.')
+			return False
+		attempt += 1
+		print_l('Retry ' + str(attempt) + ' of ' + str(retries) + ' in ' + 
+			str(wait) + ' seconds.')
+		time.sleep(wait)
+# --------------------------------------------/
+
+
+# --------------------------------------------\
+#  Given an open session, request a list of URLs concurrently.
+#  Last update: 2026/10/18 @ 11:59pm.
+#
+#  A generator of (url, request) in the same order as urls.
+#  headers = optional list of request headers, one per URL (or None).
+#  request is False for a URL when get_url() gives up (or the status, see
+#  get_url() gone).
+#  At most "workers" requests are in flight; a window of 2 x workers
+#  bounds buffered responses. Pacing comes from set_rate().
+# --------------------------------------------\
+def get_urls(session, urls, workers:int = 4, headers = None, 
+	gone:bool = False) :
+
+	# --- Vars. ---
+	window = 2 * workers
+	pending = collections.deque()
+	if None == headers :
+		headers = [None] * len(urls)
+
+	# --- Request URLs, yield responses in order. ---
+	with ThreadPoolExecutor(max_workers = workers) as pool :
+		for url, url_headers in zip(urls, headers) :
+			pending.append((url, pool.submit(get_url, session, url, 
+				url_headers, gone)))
+			if len(pending) >= window :
+				url, future = pending.popleft()
+				yield url, future.result()
+		while len(pending) > 0 :
+			url, future = pending.popleft()
+			yield url, future.result()
+# --------------------------------------------/
+
+
+# --------------------------------------------\
+#  Return a script option.
+#  Last update: 2026/10/18 @ 03:00pm.
+#
+#  Command line "--name value" (or "--name=value") wins, then an
+#  instructions file line "name : value", then the default.
+#  A command line "--name" without a value returns True.
+# --------------------------------------------\
+def get_option(name, default=None) :
+
+	# --- Vars. ---
+	flag = '--' + name
+	args = sys.argv[1:]
+
+	# --- Command line. ---
+	for i in range(len(args)) :
+		if flag == args[i] :
+			if i+1 < len(args) and not args[i+1].startswith('--') :
+				return args[i+1]
+			return True
+		if args[i].startswith(flag + '=') :
+			return args[i].split('=', 1)[1]
+
+	# --- Instructions file. ---
+	return options.get(name, default)
 # --------------------------------------------/
 
 